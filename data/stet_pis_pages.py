@@ -3,11 +3,19 @@
 from __future__ import annotations
 
 import re
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timezone
+from functools import cached_property
+from typing import Any
 from urllib.parse import urljoin
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from woob.browser.filters.json import Dict
-from woob.browser.filters.standard import CleanText, Coalesce, Map, Type
+from woob.browser.filters.standard import CleanText, Map
 from woob.browser.pages import JsonPage, RawPage
 from woob.capabilities.payment import PaymentAccount
 
@@ -23,6 +31,25 @@ from .utils import (
 class ErrorPage(RawPage):
     """Generic error page for STET APIs."""
 
+    @cached_property
+    def json_doc(self) -> Any:
+        """Get the decoded JSON body of the response, if any.
+
+        The body is decoded at most once per page, so that every error
+        check on the page can share it. Empty bodies and bodies that are
+        not announced as JSON are not decoded at all.
+
+        :return: The decoded document, or None if the body is not JSON.
+        """
+        content_type = self.response.headers.get("Content-Type", "")
+        if "json" not in content_type or not self.response.content:
+            return None
+
+        try:
+            return self.response.json()
+        except Exception:
+            return None
+
     def raise_if_basic_error_found(self) -> None:
         """Raise an exception if we manage to find a basic error.
 
@@ -40,17 +67,13 @@ class ErrorPage(RawPage):
 
         :raises StetError: An error has been found.
         """
-        try:
-            doc = self.response.json()
-            title = Coalesce(
-                Dict("error", default=None),
-                Dict("errorCode", default=None),
-            )(doc)
-            detail = Coalesce(
-                Dict("message", default=None),
-                Dict("errorDescription", default=None),
-            )(doc)
-        except Exception:
+        doc = self.json_doc
+        if not isinstance(doc, dict):
+            return
+
+        title = doc.get("error") or doc.get("errorCode")
+        detail = doc.get("message") or doc.get("errorDescription")
+        if not title or not detail:
             return
 
         raise StetException(
@@ -64,29 +87,49 @@ class ErrorPage(RawPage):
         self.raise_if_basic_error_found()
 
 
-class OAuthTokenPage(JsonPage):
+class FastJsonPage(JsonPage):
+    """JSON page decoded with orjson when it is available.
+
+    Falls back to the default woob decoder otherwise.
+    """
+
+    def build_doc(self, content):
+        if orjson is None:
+            return super().build_doc(content)
+
+        return orjson.loads(content)
+
+
+class OAuthTokenPage(FastJsonPage):
     """Page containing token data."""
 
     def get_token_data(self) -> OAuthTokenData:
         """Get the obtained OAuth2 token data."""
+        doc = self.doc
+
         expires_at = None
-        expires_in = Type(
-            Dict("expires_in", default=None),
-            type=int,
-            default=None,
-        )(self.doc)
+        expires_in = doc.get("expires_in")
         if expires_in is not None:
-            expires_at = datetime.utcnow() + timedelta(seconds=expires_in)
+            try:
+                expires_in = int(expires_in)
+            except (TypeError, ValueError):
+                pass
+            else:
+                expires_at = datetime.fromtimestamp(
+                    time.time() + expires_in,
+                    tz=timezone.utc,
+                )
 
         return OAuthTokenData(
-            token=Dict("access_token")(self.doc),
-            token_type=Dict("token_type", default=None)(self.doc),
+            # Keep the filter here so that a missing token raises as before.
+            token=Dict("access_token")(doc),
+            token_type=doc.get("token_type"),
             expires_at=expires_at,
-            refresh_token=Dict("refresh_token", default=None)(self.doc),
+            refresh_token=doc.get("refresh_token"),
         )
 
 
-class PaymentOperationPage(JsonPage):
+class PaymentOperationPage(FastJsonPage):
     """Base page with payment operation validation data.
 
     This includes payment initiation and cancellation pages.
@@ -113,7 +156,11 @@ class PaymentOperationPage(JsonPage):
             else:
                 raise AssertionError(f"Unknown format for link {link!r}")
 
-            links[key] = urljoin(base, url)
+            # Absolute URLs do not need to be resolved against the base.
+            if url.startswith(("http://", "https://")):
+                links[key] = url
+            else:
+                links[key] = urljoin(base, url)
 
         return links
 
@@ -157,6 +204,13 @@ class NewPaymentPage(PaymentOperationPage):
         :return: The obtained payment identifier from the page.
         """
         location = self.response.headers["Location"]
+
+        # Fast path: the identifier is the last path segment after
+        # 'payment-requests/', so a plain partition is enough most of the time.
+        _, sep, tail = location.rpartition("payment-requests/")
+        if sep and tail and "/" not in tail:
+            return tail
+
         match = self.PAYMENT_LOCATION_RE.search(location)
         if match is None:
             raise ValueError("Unable to find the payment identifier.")
@@ -164,9 +218,13 @@ class NewPaymentPage(PaymentOperationPage):
         return match.group(1)
 
 
-class PaymentPage(JsonPage):
+class PaymentPage(FastJsonPage):
     """Page containing payment data."""
 
+    # Filters applied on each instruction, built once for all pages.
+    _TX_STATUS = CleanText(Dict("transactionStatus", default=None), default=None)
+    _TX_REASON = CleanText(Dict("statusReasonInformation", default=None), default=None)
+
     def get_status_data(self) -> PaymentStatusData:
         """Get status data regarding the current payment."""
         return PaymentStatusData(
@@ -212,20 +270,20 @@ class PaymentPage(JsonPage):
 
     def get_instruction_status_data(self) -> list[PaymentStatusData]:
         """Get status data regarding the instructions."""
+        try:
+            sections = self.doc["paymentRequest"]["creditTransferTransaction"]
+        except (KeyError, TypeError):
+            # Let the filter raise its usual error on unexpected documents.
+            sections = Dict("paymentRequest/creditTransferTransaction")(self.doc)
+
+        tx_status = self._TX_STATUS
+        tx_reason = self._TX_REASON
         return [
             PaymentStatusData(
-                status=CleanText(
-                    Dict("transactionStatus", default=None),
-                    default=None,
-                )(section)
-                or None,
-                status_reason=CleanText(
-                    Dict("statusReasonInformation", default=None),
-                    default=None,
-                )(section)
-                or None,
+                status=tx_status(section) or None,
+                status_reason=tx_reason(section) or None,
             )
-            for section in Dict("paymentRequest/creditTransferTransaction")(self.doc)
+            for section in sections
         ]
 
 
@@ -0,0 +1,166 @@
+"""Tests of the extraction patterns found by CodeAnalyzer in Woob files."""
+
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+from woob_gap_analyzer.api_gap_analyzer.code_analyzer import (
+    ClassRec,
+    CodeAnalyzer,
+    DictFilterRec,
+    EndpointRec,
+    ImportRec,
+    MethodRec,
+    ObjMethodRec,
+)
+
+PAGES = '''\
+from woob.browser.pages import JsonPage, LoggedPage
+from woob.browser.filters.json import (
+    Dict,
+    ItemElement as Item,
+)
+import woob.tools.date as wdate
+
+
+class AccountsPage(LoggedPage, JsonPage):
+    def get_iban(self):
+        return Dict("account/iban")(self.doc)
+
+    def get_balance(self, currency):
+        return Dict(
+            "balances/amount"
+        )(self.doc)
+
+    class item(Item):
+        obj_id = Dict("resourceId")
+
+        def obj_label(self):
+            return Dict("name")(self)
+'''
+
+BROWSER = '''\
+from woob.browser import URL
+
+from .pages import AccountsPage
+
+
+class FooBrowser:
+    accounts = URL(r"/accounts$", AccountsPage)
+'''
+
+
+class CodeAnalyzerTest(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        module_dir = Path(tmp_dir.name) / "modules" / "foo"
+        module_dir.mkdir(parents=True)
+        (module_dir / "pages.py").write_text(PAGES)
+        (module_dir / "browser.py").write_text(BROWSER)
+        self.analyzer = CodeAnalyzer(tmp_dir.name)
+
+    def test_pages(self):
+        analysis = self.analyzer.analyze_extraction_patterns("modules/foo/pages.py")
+
+        self.assertEqual(
+            analysis["imports"],
+            [
+                ImportRec("from", "woob.browser.pages", "JsonPage", "JsonPage"),
+                ImportRec("from", "woob.browser.pages", "LoggedPage", "LoggedPage"),
+                ImportRec("from", "woob.browser.filters.json", "Dict", "Dict"),
+                ImportRec("from", "woob.browser.filters.json", "ItemElement", "Item"),
+                ImportRec("import", "woob.tools.date", "date", "wdate"),
+            ],
+        )
+        self.assertEqual(
+            analysis["classes"],
+            [
+                ClassRec(
+                    name="AccountsPage",
+                    bases=["LoggedPage", "JsonPage"],
+                    line=9,
+                    methods=[
+                        MethodRec("get_iban", 10, "self"),
+                        MethodRec("get_balance", 13, "self, currency"),
+                    ],
+                ),
+            ],
+        )
+        # Filters whose path is on the next line are found too
+        self.assertEqual(
+            analysis["dict_filters"],
+            [
+                DictFilterRec("account/iban", 11, 'return Dict("account/iban")(self.doc)'),
+                DictFilterRec("balances/amount", 14, "return Dict("),
+                DictFilterRec("resourceId", 19, 'obj_id = Dict("resourceId")'),
+                DictFilterRec("name", 22, 'return Dict("name")(self)'),
+            ],
+        )
+        self.assertEqual(
+            analysis["obj_methods"],
+            [
+                ObjMethodRec(
+                    "obj_id", "id", 19, 'Dict("resourceId")', "attribute", ["resourceId"]
+                ),
+                ObjMethodRec(
+                    "obj_label",
+                    "label",
+                    21,
+                    '            return Dict("name")(self)',
+                    "method",
+                    ["name"],
+                ),
+            ],
+        )
+        self.assertEqual(analysis["url_endpoints"], [])
+
+    def test_browser(self):
+        analysis = self.analyzer.analyze_extraction_patterns("modules/foo/browser.py")
+
+        self.assertEqual(
+            analysis["url_endpoints"],
+            [
+                EndpointRec(
+                    "accounts",
+                    "/accounts$",
+                    "AccountsPage",
+                    7,
+                    'accounts = URL(r"/accounts$", AccountsPage)',
+                ),
+            ],
+        )
+
+    def test_analysis_is_a_copy(self):
+        analysis = self.analyzer.analyze_extraction_patterns("modules/foo/browser.py")
+        analysis["extra"] = True
+
+        self.assertNotIn(
+            "extra", self.analyzer.analyze_extraction_patterns("modules/foo/browser.py")
+        )
+
+    def test_missing_file(self):
+        self.assertEqual(self.analyzer.extract_classes("modules/foo/missing.py"), [])
+
+    def test_file_created_after_listing(self):
+        (self.analyzer.woob_root / "modules/foo/module.py").write_text(
+            textwrap.dedent(
+                """\
+                from .browser import FooBrowser
+
+
+                class FooModule(Module):
+                    BROWSER = FooBrowser
+                """
+            )
+        )
+
+        self.assertEqual(
+            [cls.name for cls in self.analyzer.extract_classes("modules/foo/module.py")],
+            ["FooModule"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
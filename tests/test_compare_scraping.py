@@ -0,0 +1,130 @@
+"""Tests of the caches and the combined analysis helpers of compare_scraping."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from woob_gap_analyzer.api_gap_analyzer.bedrock_client import DEFAULT_MODEL_ID
+from woob_gap_analyzer.compare_scraping import (
+    analysis_cache_key,
+    load_cached_analysis,
+    load_cached_exploration,
+    save_cached_analysis,
+    save_cached_exploration,
+    split_combined_analysis,
+)
+
+
+class ExplorationCacheTest(unittest.TestCase):
+    """Cached explorations are reused until one of their files changes."""
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.woob_root = Path(tmp_dir.name) / "woob"
+        self.cache_dir = Path(tmp_dir.name) / "cache"
+
+        for file in ("modules/foo/module.py", "modules/foo/browser.py", "woob/parent.py"):
+            path = self.woob_root / file
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("# empty\n")
+
+        self.woob_analysis = {
+            "main_file": "modules/foo/module.py",
+            "main_analysis": {"browser_file": "modules/foo/browser.py"},
+            "parent_analysis": {
+                "woob/parent.py:ParentBrowser": {"file": "woob/parent.py", "browser_file": None},
+            },
+            "extracted_fields": {"id": []},
+        }
+
+    def test_hit(self):
+        save_cached_exploration(self.cache_dir, "foo", self.woob_root, self.woob_analysis)
+
+        self.assertEqual(load_cached_exploration(self.cache_dir, "foo"), self.woob_analysis)
+
+    def test_miss(self):
+        self.assertIsNone(load_cached_exploration(self.cache_dir, "foo"))
+
+    def test_parent_file_changed(self):
+        save_cached_exploration(self.cache_dir, "foo", self.woob_root, self.woob_analysis)
+
+        parent_file = self.woob_root / "woob/parent.py"
+        mtime_ns = parent_file.stat().st_mtime_ns
+        os.utime(parent_file, ns=(mtime_ns, mtime_ns + 1_000_000_000))
+
+        self.assertIsNone(load_cached_exploration(self.cache_dir, "foo"))
+
+
+class AnalysisCacheTest(unittest.TestCase):
+    """Cached Bedrock analyses are keyed by all the inputs of the analysis."""
+
+    def test_key_depends_on_model(self):
+        key = analysis_cache_key("prompt", b"{}", "context", "model-a")
+
+        self.assertEqual(key, analysis_cache_key("prompt", b"{}", "context", "model-a"))
+        self.assertNotEqual(key, analysis_cache_key("prompt", b"{}", "context", "model-b"))
+
+    def test_key_resolves_default_model(self):
+        self.assertEqual(
+            analysis_cache_key("prompt", b"{}", "context"),
+            analysis_cache_key("prompt", b"{}", "context", DEFAULT_MODEL_ID),
+        )
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_dir = Path(tmp_dir)
+            key = analysis_cache_key("prompt", b"{}", "context")
+            analysis_result = {"status": "success", "analysis": "x" * 10000}
+
+            self.assertIsNone(load_cached_analysis(cache_dir, key))
+            save_cached_analysis(cache_dir, key, analysis_result)
+            self.assertEqual(load_cached_analysis(cache_dir, key), analysis_result)
+
+
+class SplitCombinedAnalysisTest(unittest.TestCase):
+    """Combined analyses are split into results for each module."""
+
+    usage = {"input_tokens": 1, "output_tokens": 2}
+
+    def test_split(self):
+        results = split_combined_analysis(
+            {
+                "status": "success",
+                "analyses": {"foo": "report foo", "bar": "report bar"},
+                "usage": self.usage,
+                "model": "model",
+            },
+            ["foo", "bar"],
+        )
+
+        self.assertEqual(results["foo"]["status"], "success")
+        self.assertEqual(results["foo"]["analysis"], "report foo")
+        self.assertEqual(results["bar"]["analysis"], "report bar")
+
+    def test_missing_report(self):
+        results = split_combined_analysis(
+            {
+                "status": "success",
+                "analyses": {"foo": "report foo"},
+                "usage": self.usage,
+                "model": "model",
+            },
+            ["foo", "bar"],
+        )
+
+        # Left out, to be analyzed on its own
+        self.assertEqual(list(results), ["foo"])
+        self.assertEqual(results["foo"]["analysis"], "report foo")
+
+    def test_failed_analysis(self):
+        analysis_result = {"status": "error", "error": "throttled", "model": "model"}
+
+        results = split_combined_analysis(analysis_result, ["foo", "bar"])
+
+        self.assertEqual(results, {"foo": analysis_result, "bar": analysis_result})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+"""Tests of the STET payment pages in data/stet_pis_pages.py.
+
+The pages are a copy of the STET payment module pages of Woob, and import
+its utils. They are loaded against the Woob codebase found at $WOOB_ROOT
+(default: ~/dev/woob), and skipped when Woob is not available.
+"""
+
+import importlib.util
+import json
+import logging
+import os
+import sys
+import types
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+WOOB_ROOT = Path(os.environ.get("WOOB_ROOT", "~/dev/woob")).expanduser()
+PAYMENT_DIR = WOOB_ROOT / "modules" / "stet" / "payment"
+
+
+def _load_pages():
+    """Load the pages as a sibling of the utils of the STET payment module.
+
+    Returns:
+        The pages module, or None if Woob is not available
+    """
+    if importlib.util.find_spec("woob") is None or not (PAYMENT_DIR / "utils.py").is_file():
+        return None
+
+    package = types.ModuleType("stet_payment")
+    package.__path__ = [str(PAYMENT_DIR)]
+    sys.modules["stet_payment"] = package
+
+    spec = importlib.util.spec_from_file_location(
+        "stet_payment.pis_pages", DATA_DIR / "stet_pis_pages.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+pages = _load_pages()
+
+
+def make_page(page_class, body=b"", content_type="application/json", url=None, headers=None):
+    """Build a page from a response, as the browser would.
+
+    Args:
+        page_class: Class of the page
+        body: Response body, as bytes or as a document to encode in JSON
+        content_type: Content-Type of the response
+        url: URL of the response
+        headers: Other headers of the response
+
+    Returns:
+        Page instance
+    """
+    from requests import Response
+
+    response = Response()
+    response.status_code = 200
+    response.url = url or "https://api.bank.example/v1/payment-requests"
+    response.encoding = "utf-8"
+    response.headers["Content-Type"] = content_type
+    response.headers.update(headers or {})
+    response._content = body if isinstance(body, bytes) else json.dumps(body).encode()
+
+    browser = SimpleNamespace(logger=logging.getLogger(__name__))
+    return page_class(browser, response)
+
+
+@unittest.skipIf(pages is None, "Woob and its STET payment module are not available")
+class ErrorPageTest(unittest.TestCase):
+    def test_json_doc(self):
+        page = make_page(pages.ErrorPage, {"error": "Bad Request"})
+
+        self.assertEqual(page.json_doc, {"error": "Bad Request"})
+
+    def test_json_doc_not_json(self):
+        page = make_page(pages.ErrorPage, b'{"error": "x"}', content_type="text/html")
+
+        self.assertIsNone(page.json_doc)
+
+    def test_json_doc_empty(self):
+        self.assertIsNone(make_page(pages.ErrorPage, b"").json_doc)
+
+    def test_json_doc_invalid(self):
+        self.assertIsNone(make_page(pages.ErrorPage, b"<html>").json_doc)
+
+    def test_basic_error(self):
+        page = make_page(
+            pages.ErrorPage,
+            {"status": 400, "error": "Bad Request", "message": "Missing header"},
+        )
+
+        with self.assertRaises(pages.StetException):
+            page.raise_if_error_found()
+
+    def test_no_error(self):
+        make_page(pages.ErrorPage, {"status": 400}).raise_if_error_found()
+        make_page(pages.ErrorPage, b"", content_type="text/plain").raise_if_error_found()
+
+
+@unittest.skipIf(pages is None, "Woob and its STET payment module are not available")
+class PaymentPagesTest(unittest.TestCase):
+    def test_token_data(self):
+        page = make_page(
+            pages.OAuthTokenPage,
+            {"access_token": "abc", "token_type": "Bearer", "expires_in": "3600"},
+        )
+
+        token_data = page.get_token_data()
+
+        self.assertEqual(token_data.token, "abc")
+        self.assertEqual(token_data.token_type, "Bearer")
+        self.assertIsNotNone(token_data.expires_at)
+        self.assertIsNone(token_data.refresh_token)
+
+    def test_links(self):
+        page = make_page(
+            pages.PaymentOperationPage,
+            {
+                "_links": {
+                    "consentApproval": {"href": "https://bank.example/sca?id=1"},
+                    "self": "/v1/payment-requests/1",
+                    "status": None,
+                },
+            },
+        )
+
+        self.assertEqual(
+            page.get_links(),
+            {
+                "consentApproval": "https://bank.example/sca?id=1",
+                "self": "https://api.bank.example/v1/payment-requests/1",
+            },
+        )
+
+    def test_payment_id(self):
+        for location in (
+            "payment-requests/xyz",
+            "/v1/payment-requests/xyz",
+            "https://api.bank.example/v1/payment-requests/xyz",
+        ):
+            with self.subTest(location=location):
+                page = make_page(pages.NewPaymentPage, headers={"Location": location})
+                self.assertEqual(page.get_payment_id(), "xyz")
+
+    def test_payment_id_missing(self):
+        page = make_page(pages.NewPaymentPage, headers={"Location": "/v1/other/xyz"})
+
+        with self.assertRaises(ValueError):
+            page.get_payment_id()
+
+    def test_instruction_status_data(self):
+        page = make_page(
+            pages.PaymentPage,
+            {
+                "paymentRequest": {
+                    "creditTransferTransaction": [
+                        {"transactionStatus": "ACSC"},
+                        {"transactionStatus": "RJCT", "statusReasonInformation": "AC04"},
+                    ],
+                },
+            },
+        )
+
+        self.assertEqual(
+            [(data.status, data.status_reason) for data in page.get_instruction_status_data()],
+            [("ACSC", None), ("RJCT", "AC04")],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
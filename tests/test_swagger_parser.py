@@ -0,0 +1,109 @@
+"""Tests of the Swagger endpoint listing and schema flattening of SwaggerParser."""
+
+import json
+import unittest
+
+from woob_gap_analyzer.api_gap_analyzer.swagger_parser import SwaggerParser
+
+SPEC = {
+    "openapi": "3.0.0",
+    "paths": {
+        "/accounts": {
+            "parameters": [],
+            "get": {
+                "operationId": "getAccounts",
+                "responses": {
+                    "200": {
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": "#/components/schemas/AccountList"},
+                            },
+                        },
+                    },
+                },
+            },
+        },
+        "/payment-requests": {
+            "post": {"operationId": "createPayment", "responses": {}},
+        },
+    },
+    "components": {
+        "schemas": {
+            "AccountList": {
+                "type": "object",
+                "required": ["accounts"],
+                "properties": {
+                    "accounts": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/Account"},
+                    },
+                    "main": {"$ref": "#/components/schemas/Account"},
+                },
+            },
+            "Account": {
+                "type": "object",
+                "required": ["iban"],
+                "properties": {
+                    "iban": {"type": "string", "description": "Account IBAN"},
+                    "usage": {"type": "string", "enum": ["PRIV", "ORGA"]},
+                    "parent": {"$ref": "#/components/schemas/Account"},
+                },
+            },
+        },
+    },
+}
+
+
+class SwaggerParserTest(unittest.TestCase):
+    def setUp(self):
+        self.parser = SwaggerParser.from_string(json.dumps(SPEC))
+
+    def test_all_endpoints(self):
+        endpoints = self.parser.get_all_endpoints()
+
+        # Path-level entries that are not HTTP methods are skipped
+        self.assertEqual(
+            [(e["method"], e["path"]) for e in endpoints],
+            [("GET", "/accounts"), ("POST", "/payment-requests")],
+        )
+
+    def test_all_endpoints_returns_new_list(self):
+        self.parser.get_all_endpoints().clear()
+
+        self.assertEqual(len(self.parser.get_all_endpoints()), 2)
+        self.assertIsNotNone(self.parser.get_endpoint_by_operation_id("createPayment"))
+
+    def test_flatten_schema(self):
+        endpoint = self.parser.get_endpoint_by_operation_id("getAccounts")
+
+        fields = self.parser.get_response_fields(endpoint)
+
+        # A schema referenced by two sibling properties is expanded under both,
+        # array items are named "<array>[]<field>" and a $ref being expanded
+        # is not expanded again below itself
+        self.assertEqual(
+            list(fields),
+            [
+                "accounts",
+                "accounts[]iban",
+                "accounts[]usage",
+                "accounts[]parent",
+                "main",
+                "main.iban",
+                "main.usage",
+                "main.parent",
+            ],
+        )
+        self.assertEqual(
+            fields["accounts"], {"type": "array", "required": True, "description": ""}
+        )
+        self.assertEqual(
+            fields["main.iban"],
+            {"type": "string", "required": True, "description": "Account IBAN"},
+        )
+        self.assertEqual(fields["main.usage"]["enum"], ["PRIV", "ORGA"])
+        self.assertEqual(fields["main.parent"]["type"], "unknown")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,13 +2,115 @@
 
 import logging
 import os
-from typing import Any, Dict, Optional
-
-import boto3
-from botocore.exceptions import BotoCoreError, ClientError
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+# Model used when none is given
+DEFAULT_MODEL_ID = "eu.anthropic.claude-haiku-4-5-20251001-v1:0"
+
+# Instructions sent after the analysis context, kept byte-identical across calls
+GAP_ANALYSIS_INSTRUCTIONS = """
+
+Please analyze the gap between the Swagger API specification and the Woob implementation.
+Identify all discrepancies, missing fields, type mismatches, and other issues.
+Provide a detailed report with specific locations and suggested fixes."""
+
+# Instructions sent after the context of several modules analyzed at once
+COMBINED_GAP_ANALYSIS_INSTRUCTIONS = """
+
+Please analyze the gap between the Swagger API specification and the Woob implementation of
+each module above, separately.
+Identify all discrepancies, missing fields, type mismatches, and other issues.
+Provide a detailed report with specific locations and suggested fixes.
+Write one report per module, in the order of the modules above, each starting with a line
+"### REPORT: <module name>" and containing nothing about the other modules."""
+
+# Line starting the report of a module in a combined analysis, tolerating
+# other heading levels, emphasis and case, e.g. "## **Report: `module`**"
+_RE_MODULE_REPORT = re.compile(
+    r"^[#*\t ]*REPORT[\t ]*:[`*\t ]*(\w+)[`*\t ]*$",
+    re.MULTILINE | re.IGNORECASE,
+)
+
+# Bedrock clients by (profile, region), shared by all analyzers of the process
+_CLIENTS: Dict[Tuple[str, str], Any] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+# Marks the end of a prompt prefix that Bedrock may cache across calls
+_CACHE_POINT = {"cachePoint": {"type": "default"}}
+# Rough text length of a token, to estimate prompt prefix sizes
+_CHARS_PER_TOKEN = 4
+
+
+def _get_client(aws_profile: str, aws_region: str) -> Any:
+    """Get the Bedrock runtime client of a profile and region, created once.
+
+    Creating a client resolves credentials and endpoints, and each client
+    has its own connection pool, so clients are shared across analyzers.
+
+    Args:
+        aws_profile: AWS profile name
+        aws_region: AWS region
+
+    Returns:
+        Bedrock runtime client
+    """
+    # boto3 is slow to import, only load it once a client is actually needed
+    import boto3
+
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get((aws_profile, aws_region))
+        if client is None:
+            session = boto3.Session(profile_name=aws_profile, region_name=aws_region)
+            client = session.client("bedrock-runtime", region_name=aws_region)
+            _CLIENTS[aws_profile, aws_region] = client
+        return client
+
+
+# Maximum output tokens of models, by model ID fragment, most specific first
+_MAX_OUTPUT_TOKENS = (
+    ("claude-3-7", 64000),
+    ("claude-3-5", 8192),
+    ("claude-3-", 4096),
+    ("claude-opus-4-5", 64000),
+    ("claude-opus-4", 32000),
+    ("claude-sonnet-4", 64000),
+    ("claude-haiku-4", 64000),
+)
+# Maximum output tokens assumed for other models
+_DEFAULT_MAX_OUTPUT_TOKENS = 4096
+
+
+def _max_output_tokens(model_id: str) -> int:
+    """Get the maximum number of tokens a model may generate in a response.
+
+    Args:
+        model_id: Bedrock model ID
+
+    Returns:
+        Maximum number of output tokens
+    """
+    for fragment, max_tokens in _MAX_OUTPUT_TOKENS:
+        if fragment in model_id:
+            return max_tokens
+    return _DEFAULT_MAX_OUTPUT_TOKENS
+
+
+def _min_cache_tokens(model_id: str) -> int:
+    """Get the minimum size of a prompt prefix that Bedrock caches.
+
+    Args:
+        model_id: Bedrock model ID
+
+    Returns:
+        Minimum number of tokens of a cached prefix
+    """
+    return 2048 if "haiku" in model_id else 1024
+
 
 class BedrockAnalyzer:
     """Client for sending analysis requests to AWS Bedrock."""
@@ -18,6 +120,8 @@ class BedrockAnalyzer:
         model_id: Optional[str] = None,
         aws_profile: Optional[str] = None,
         aws_region: Optional[str] = None,
+        prompt_caching: bool = True,
+        latency_mode: str = "standard",
     ):
         """Initialize Bedrock client using AWS SSO profile.
 
@@ -25,18 +129,28 @@ class BedrockAnalyzer:
             model_id: Bedrock model ID (default: Claude Haiku)
             aws_profile: AWS profile name (default: from AWS_PROFILE env var or 'playground-hackathon')
             aws_region: AWS region (default: from AWS_REGION env var or 'eu-west-3')
+            prompt_caching: Whether to mark the system prompt and the Swagger
+                specification as cacheable prompt prefixes
+            latency_mode: Bedrock inference latency, 'standard' or 'optimized'
+                (only available for some models and regions)
 
         Raises:
             ValueError: If AWS profile is not configured
         """
-        self.model_id = model_id or "eu.anthropic.claude-haiku-4-5-20251001-v1:0"
+        self.model_id = model_id or DEFAULT_MODEL_ID
         self.aws_profile = aws_profile or os.getenv("AWS_PROFILE", "playground-hackathon")
         self.aws_region = aws_region or os.getenv("AWS_REGION", "eu-west-3")
+        self.prompt_caching = prompt_caching
+        self.latency_mode = latency_mode
+
+        # boto3 is slow to import, only load it once a client is actually needed
+        from botocore.exceptions import BotoCoreError, ClientError
+
+        self._errors = (BotoCoreError, ClientError)
 
         # Initialize Bedrock client using SSO profile
         try:
-            session = boto3.Session(profile_name=self.aws_profile, region_name=self.aws_region)
-            self.client = session.client("bedrock-runtime", region_name=self.aws_region)
+            self.client = _get_client(self.aws_profile, self.aws_region)
             logger.info(
                 f"Bedrock client initialized (profile: {self.aws_profile}, region: {self.aws_region})"
             )
@@ -50,49 +164,100 @@ class BedrockAnalyzer:
     def send_analysis_request(
         self,
         system_prompt: str,
-        user_message: str,
+        user_message: Union[str, List[Dict[str, str]]],
         max_tokens: int = 10000,
         temperature: float = 0.5,
+        cache_system_prompt: bool = False,
+        on_text: Optional[Callable[[str], None]] = None,
     ) -> Dict[str, Any]:
         """Send an analysis request to Bedrock.
 
         Args:
             system_prompt: System prompt for the model
-            user_message: User message/question
+            user_message: User message/question, as a string or a list of content blocks
             max_tokens: Maximum tokens in response
             temperature: Model temperature (0-1)
+            cache_system_prompt: Whether to mark the system prompt as a
+                cacheable prompt prefix
+            on_text: Function called with each piece of the response text as
+                soon as it is received, to stream the response
 
         Returns:
-            Response dictionary with model output
+            Response dictionary with model output, in the format of a
+            non-streamed response
 
         Raises:
             RuntimeError: If Bedrock API call fails
         """
+        if isinstance(user_message, str):
+            user_message = [{"text": user_message}]
+
+        system = [{"text": system_prompt}]
+        if cache_system_prompt:
+            system.append(_CACHE_POINT)
+
         try:
             logger.debug(f"Sending request to Bedrock model: {self.model_id}")
 
-            response = self.client.converse(
-                modelId=self.model_id,
-                messages=[
+            request = {
+                "modelId": self.model_id,
+                "messages": [
                     {
                         "role": "user",
-                        "content": [{"text": user_message}],
+                        "content": user_message,
                     }
                 ],
-                system=[{"text": system_prompt}],
-                inferenceConfig={
+                "system": system,
+                "inferenceConfig": {
                     "maxTokens": max_tokens,
                     "temperature": temperature,
                 },
-            )
+            }
+            # Older botocore versions reject the parameter, only send it when needed
+            if self.latency_mode == "optimized":
+                request["performanceConfig"] = {"latency": "optimized"}
+
+            if on_text is None:
+                response = self.client.converse(**request)
+            else:
+                response = self._receive_stream(self.client.converse_stream(**request), on_text)
 
             logger.debug("Bedrock request completed successfully")
             return response
 
-        except (BotoCoreError, ClientError) as e:
+        except self._errors as e:
             logger.error(f"Bedrock API error: {e}")
             raise RuntimeError(f"Bedrock API call failed: {e}") from e
 
+    @staticmethod
+    def _receive_stream(
+        response: Dict[str, Any], on_text: Callable[[str], None]
+    ) -> Dict[str, Any]:
+        """Receive a streamed response, passing its text on as it arrives.
+
+        Args:
+            response: Response dictionary from converse_stream()
+            on_text: Function called with each piece of the response text
+
+        Returns:
+            Response dictionary in the format of a converse() response
+        """
+        parts = []
+        usage = {}
+        for event in response["stream"]:
+            if "contentBlockDelta" in event:
+                text = event["contentBlockDelta"]["delta"].get("text")
+                if text:
+                    parts.append(text)
+                    on_text(text)
+            elif "metadata" in event:
+                usage = event["metadata"].get("usage", {})
+
+        return {
+            "output": {"message": {"content": [{"text": "".join(parts)}]}},
+            "usage": usage,
+        }
+
     def extract_response_text(self, response: Dict[str, Any]) -> str:
         """Extract text content from Bedrock response.
 
@@ -118,83 +283,102 @@ class BedrockAnalyzer:
             response: Response dictionary from Bedrock
 
         Returns:
-            Dictionary with input_tokens and output_tokens
+            Dictionary with input_tokens, output_tokens, cache_read_tokens
+            and cache_write_tokens
         """
         try:
             usage = response.get("usage", {})
             return {
                 "input_tokens": usage.get("inputTokens", 0),
                 "output_tokens": usage.get("outputTokens", 0),
+                "cache_read_tokens": usage.get("cacheReadInputTokens", 0),
+                "cache_write_tokens": usage.get("cacheWriteInputTokens", 0),
             }
         except (KeyError, TypeError) as e:
             logger.error(f"Failed to extract usage stats: {e}")
-            return {"input_tokens": 0, "output_tokens": 0}
+            return {
+                "input_tokens": 0,
+                "output_tokens": 0,
+                "cache_read_tokens": 0,
+                "cache_write_tokens": 0,
+            }
 
     def format_context_for_llm(
-        self, swagger_spec: str, woob_analysis: str, comparison_data: Optional[str] = None
-    ) -> str:
+        self,
+        swagger_spec: Union[str, bytes],
+        woob_analysis: str,
+        comparison_data: Optional[str] = None,
+    ) -> List[Dict[str, str]]:
         """Format analysis context for LLM.
 
+        The context is returned as separate Bedrock text content blocks, so
+        that the (potentially large) inputs are never concatenated together.
+
         Args:
-            swagger_spec: Swagger specification content
+            swagger_spec: Swagger specification content, as text or UTF-8 bytes
             woob_analysis: Woob implementation analysis
             comparison_data: Optional comparison results
 
         Returns:
-            Formatted context string
+            List of text content blocks
         """
-        context = f"""# Analysis Context
-
-## Swagger API Specification
-```json
-{swagger_spec}
-```
-
-## Woob Implementation Analysis
-```
-{woob_analysis}
-```
-"""
+        # Specs may be kept as read from disk until they are sent
+        if isinstance(swagger_spec, bytes):
+            swagger_spec = swagger_spec.decode("utf-8")
+
+        blocks = [
+            {"text": "# Analysis Context\n\n## Swagger API Specification\n```json\n"},
+            {"text": swagger_spec},
+            {"text": "\n```\n\n## Woob Implementation Analysis\n```\n"},
+            {"text": woob_analysis},
+            {"text": "\n```\n"},
+        ]
 
         if comparison_data:
-            context += f"""
-## Comparison Data
-```
-{comparison_data}
-```
-"""
+            blocks.append({"text": "\n## Comparison Data\n```\n"})
+            blocks.append({"text": comparison_data})
+            blocks.append({"text": "\n```\n"})
 
-        return context
+        return blocks
 
     def analyze_gap(
         self,
-        swagger_spec: str,
+        swagger_spec: Union[str, bytes],
         woob_analysis: str,
         system_prompt: str,
         max_tokens: int = 10000,
+        on_text: Optional[Callable[[str], None]] = None,
     ) -> Dict[str, Any]:
         """Perform gap analysis between API spec and Woob implementation.
 
         Args:
-            swagger_spec: Swagger specification content
+            swagger_spec: Swagger specification content, as text or UTF-8 bytes
             woob_analysis: Woob implementation analysis
             system_prompt: System prompt for analysis
             max_tokens: Maximum tokens in response
+            on_text: Function called with each piece of the analysis as soon
+                as it is received, to stream the response
 
         Returns:
             Analysis results with issues and recommendations
         """
         logger.info("Starting gap analysis with Bedrock")
 
-        # Format context
-        context = self.format_context_for_llm(swagger_spec, woob_analysis)
-
-        # Create user message
-        user_message = f"""{context}
-
-Please analyze the gap between the Swagger API specification and the Woob implementation.
-Identify all discrepancies, missing fields, type mismatches, and other issues.
-Provide a detailed report with specific locations and suggested fixes."""
+        # Format context and append the instructions as a last block
+        user_message = self.format_context_for_llm(swagger_spec, woob_analysis)
+        user_message.append({"text": GAP_ANALYSIS_INSTRUCTIONS})
+
+        # Cache the static prefixes, the system prompt then the Swagger spec,
+        # only once they are long enough for Bedrock to cache them
+        cache_system_prompt = False
+        if self.prompt_caching:
+            min_chars = _min_cache_tokens(self.model_id) * _CHARS_PER_TOKEN
+            prefix_chars = len(system_prompt)
+            cache_system_prompt = prefix_chars >= min_chars
+            prefix_chars += len(user_message[0]["text"]) + len(user_message[1]["text"])
+            if prefix_chars >= min_chars:
+                # Right after the Swagger spec block
+                user_message.insert(2, _CACHE_POINT)
 
         # Send to Bedrock
         try:
@@ -202,6 +386,8 @@ Provide a detailed report with specific locations and suggested fixes."""
                 system_prompt=system_prompt,
                 user_message=user_message,
                 max_tokens=max_tokens,
+                cache_system_prompt=cache_system_prompt,
+                on_text=on_text,
             )
 
             # Extract results
@@ -216,7 +402,9 @@ Provide a detailed report with specific locations and suggested fixes."""
             }
 
             logger.info(
-                f"Gap analysis complete (tokens: {usage['input_tokens']} in, {usage['output_tokens']} out)"
+                f"Gap analysis complete (tokens: {usage['input_tokens']} in, "
+                f"{usage['output_tokens']} out, {usage['cache_read_tokens']} cache read, "
+                f"{usage['cache_write_tokens']} cache write)"
             )
             return result
 
@@ -227,3 +415,134 @@ Provide a detailed report with specific locations and suggested fixes."""
                 "error": str(e),
                 "model": self.model_id,
             }
+
+    def max_combined_modules(self, max_tokens: int = 10000) -> int:
+        """Get how many modules analyze_gaps_combined() may analyze in one request.
+
+        Args:
+            max_tokens: Maximum tokens in the response, for each module
+
+        Returns:
+            Number of module reports fitting in the maximum output of the model
+        """
+        return max(1, _max_output_tokens(self.model_id) // max_tokens)
+
+    def analyze_gaps_combined(
+        self,
+        modules: Sequence[Tuple[str, Union[str, bytes], str]],
+        system_prompt: str,
+        max_tokens: int = 10000,
+        on_text: Optional[Callable[[str], None]] = None,
+    ) -> Dict[str, Any]:
+        """Perform the gap analyses of several modules in a single request.
+
+        The system prompt and the instructions are only sent once for all
+        modules, and a Swagger specification shared by several modules is
+        only sent with the first of them.
+
+        Args:
+            modules: Sequence of (module_name, swagger_spec, woob_analysis) tuples
+            system_prompt: System prompt for analysis
+            max_tokens: Maximum tokens in the response, for each module, capped
+                overall to the maximum output of the model (see
+                max_combined_modules())
+            on_text: Function called with each piece of the analyses as soon
+                as it is received, to stream the response
+
+        Returns:
+            Analysis results, with the analysis of each module under "analyses"
+        """
+        logger.info(f"Starting combined gap analysis of {len(modules)} modules with Bedrock")
+
+        user_message = []
+        spec_modules: Dict[str, str] = {}
+        for module_name, swagger_spec, woob_analysis in modules:
+            blocks = self.format_context_for_llm(swagger_spec, woob_analysis)
+            if swagger_spec in spec_modules:
+                # Replaces the Swagger spec block
+                blocks[1] = {"text": f"(Same specification as module {spec_modules[swagger_spec]})"}
+            else:
+                spec_modules[swagger_spec] = module_name
+            user_message.append({"text": f"\n=== MODULE: {module_name} ===\n\n"})
+            user_message.extend(blocks)
+        user_message.append({"text": COMBINED_GAP_ANALYSIS_INSTRUCTIONS})
+
+        cache_system_prompt = self.prompt_caching and (
+            len(system_prompt) >= _min_cache_tokens(self.model_id) * _CHARS_PER_TOKEN
+        )
+
+        try:
+            response = self.send_analysis_request(
+                system_prompt=system_prompt,
+                user_message=user_message,
+                max_tokens=min(max_tokens * len(modules), _max_output_tokens(self.model_id)),
+                cache_system_prompt=cache_system_prompt,
+                on_text=on_text,
+            )
+        except RuntimeError as e:
+            logger.error(f"Combined gap analysis failed: {e}")
+            return {
+                "status": "error",
+                "error": str(e),
+                "model": self.model_id,
+            }
+
+        # Split the response on the report delimiters, dropping any preamble
+        analysis_text = self.extract_response_text(response)
+        usage = self.get_usage_stats(response)
+        analyses = {}
+        matches = list(_RE_MODULE_REPORT.finditer(analysis_text))
+        for match, next_match in zip(matches, matches[1:] + [None]):
+            end = next_match.start() if next_match else len(analysis_text)
+            analyses.setdefault(match.group(1), analysis_text[match.end() : end].strip())
+
+        logger.info(
+            f"Combined gap analysis complete (tokens: {usage['input_tokens']} in, "
+            f"{usage['output_tokens']} out, {usage['cache_read_tokens']} cache read, "
+            f"{usage['cache_write_tokens']} cache write)"
+        )
+        return {
+            "status": "success",
+            "analyses": analyses,
+            "usage": usage,
+            "model": self.model_id,
+        }
+
+    def analyze_gaps_batch(
+        self,
+        pairs: Sequence[Tuple[str, str]],
+        system_prompt: str,
+        max_tokens: int = 10000,
+        max_concurrency: int = 8,
+    ) -> List[Dict[str, Any]]:
+        """Perform several gap analyses concurrently.
+
+        Requests are dispatched on a thread pool sharing the Bedrock client, so
+        that the network latency of each call overlaps with the others.
+
+        Args:
+            pairs: Sequence of (swagger_spec, woob_analysis) tuples
+            system_prompt: System prompt for analysis
+            max_tokens: Maximum tokens in each response
+            max_concurrency: Maximum number of requests in flight
+
+        Returns:
+            Analysis results, in the same order as the input pairs
+        """
+        if not pairs:
+            return []
+
+        logger.info(f"Starting batch gap analysis of {len(pairs)} items")
+
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(pairs))) as executor:
+            futures = [
+                executor.submit(
+                    self.analyze_gap,
+                    swagger_spec=swagger_spec,
+                    woob_analysis=woob_analysis,
+                    system_prompt=system_prompt,
+                    max_tokens=max_tokens,
+                )
+                for swagger_spec, woob_analysis in pairs
+            ]
+            return [future.result() for future in futures]
@@ -1,21 +1,258 @@
 """Code analysis module for understanding Woob implementations."""
 
+import ast
+import hashlib
 import logging
+import os
+import pickle
 import re
+import sys
+import threading
+from bisect import bisect_right
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever the format of analysis results changes
+_DISK_CACHE_VERSION = 4
+# Number of files whose content and extraction results are kept in memory
+_FILE_CACHE_SIZE = 256
+
+# Records returned by the extractors, lighter than one dict per entry
+ImportRec = namedtuple("ImportRec", "type module name alias")
+ClassRec = namedtuple("ClassRec", "name bases line methods")
+MethodRec = namedtuple("MethodRec", "name line params")
+DictFilterRec = namedtuple("DictFilterRec", "path line context")
+ObjMethodRec = namedtuple("ObjMethodRec", "name field line body type dict_filters")
+EndpointRec = namedtuple("EndpointRec", "name pattern page_class line context")
+
+# Values repeated across records, shared instead of stored once per record
+_INTERN_FROM = sys.intern("from")
+_INTERN_IMPORT = sys.intern("import")
+_INTERN_METHOD = sys.intern("method")
+_INTERN_ATTRIBUTE = sys.intern("attribute")
+
+# Match, in a single pass:
+# - from X import Y [as Z], W [as V], ... (with or without parentheses)
+# - import X [as Y]
+# Multi-line parenthesized imports need no normalization, as names are stripped.
+_RE_IMPORT = re.compile(
+    r"from\s+(?P<paren_module>[\w.]+)\s+import\s+\((?P<paren_names>.*?)\)"
+    r"|from\s+(?P<from_module>[\w.]+)\s+import\s+(?P<from_names>[\w, ]+)"
+    r"|^import\s+(?P<direct_module>[\w.]+)(?:\s+as\s+(?P<direct_alias>\w+))?",
+    re.MULTILINE | re.DOTALL,
+)
+# The following patterns run over whole files, so whitespace must not span lines
+# Match: class ClassName(Base1, Base2):
+_RE_CLASS_DEF = re.compile(r"^class[^\S\n]+(\w+)[^\S\n]*\((.*?)\):", re.MULTILINE)
+_RE_METHOD_DEF = re.compile(r"^[^\S\n]+def[^\S\n]+(\w+)[^\S\n]*\((.*?)\):", re.MULTILINE)
+# Match: Dict("path/to/field")
+_RE_DICT_FILTER = re.compile(r'Dict[^\S\n]*\([^\S\n]*["\']([^"\'\n]+)["\']')
+# Match: def obj_*(...): or obj_* = ...
+_RE_OBJ_METHOD_OR_ATTR = re.compile(
+    r"^[^\S\n]+(?:def[^\S\n]+(obj_\w+)[^\S\n]*\((.*?)\):|(obj_\w+)[^\S\n]*=[^\S\n]*(.+)$)",
+    re.MULTILINE,
+)
+# Match: endpoint_name = URL(r"pattern", PageClass)
+_RE_URL_ENDPOINT = re.compile(
+    r'(\w+)[^\S\n]*=[^\S\n]*URL[^\S\n]*\([^\S\n]*r["\']([^"\'\n]+)["\']'
+)
+_RE_PAGE_CLASS = re.compile(r",\s*(\w+)\s*\)")
+# Match: Dict("path/to/field") in the body of an obj_* method, possibly across lines
+_RE_BODY_DICT_FILTER = re.compile(r'Dict\s*\(\s*["\']([^"\']+)["\']')
+
+
+@lru_cache(maxsize=None)
+def _class_end_re(class_indent: int) -> "re.Pattern[str]":
+    """Get the pattern matching the first line after a class body.
+
+    Args:
+        class_indent: Indentation of the class statement
+
+    Returns:
+        Pattern matching a non-blank line indented by at most class_indent
+    """
+    return re.compile(rf"^(?! {{{class_indent + 1}}})[^\S\n]*\S", re.MULTILINE)
+
+
+def _method_body(lines: "_SourceLines", line_num: int) -> str:
+    """Get the body of a method, limited to its first lines.
+
+    Args:
+        lines: Lines of the file
+        line_num: Line number of the def statement (1-indexed)
+
+    Returns:
+        Body of the method, up to 20 lines
+    """
+    body_lines = []
+    line = lines[line_num - 1]
+    indent = len(line) - len(line.lstrip())
+    for i in range(line_num, min(line_num + 20, len(lines))):
+        body_line = lines[i]
+        if body_line.strip() and not body_line.startswith(" " * (indent + 1)):
+            break
+        body_lines.append(body_line.rstrip())
+
+    return "\n".join(body_lines)
+
+
+def _call_name(node: ast.Call) -> Optional[str]:
+    """Get the name of the callable of a call, e.g. 'Dict' for Dict(...) or x.Dict(...).
+
+    Args:
+        node: Call node
+
+    Returns:
+        Name of the callable or None if it is not a plain name or attribute
+    """
+    func = node.func
+    if isinstance(func, ast.Name):
+        return func.id
+    if isinstance(func, ast.Attribute):
+        return func.attr
+    return None
+
+
+def _first_str_arg(node: ast.Call) -> Optional[str]:
+    """Get the first positional argument of a call if it is a string literal.
+
+    Args:
+        node: Call node
+
+    Returns:
+        The string or None
+    """
+    if node.args:
+        arg = node.args[0]
+        if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+            return arg.value
+    return None
+
+
+def _index_lines(content: str) -> List[int]:
+    """Compute the start offset of each line of file content.
+
+    The offsets allow recovering a line number from a regex match position
+    with ``bisect``, and slicing a line out of the content.
+
+    Args:
+        content: File content
+
+    Returns:
+        Line start offsets
+    """
+    line_starts = [0]
+    find = content.find
+    i = find("\n")
+    while i != -1:
+        line_starts.append(i + 1)
+        i = find("\n", i + 1)
+
+    return line_starts
+
+
+class _SourceLines:
+    """Lines of a file, sliced out of its content on access.
+
+    Indexing and len() behave like on the list returned by ``readlines()``,
+    lines keeping their trailing newline, without holding a copy of each line.
+    """
+
+    __slots__ = ("content", "line_starts")
+
+    def __init__(self, content: str, line_starts: List[int]):
+        self.content = content
+        self.line_starts = line_starts
+
+    def __len__(self) -> int:
+        # A trailing newline does not start an extra line
+        return len(self.line_starts) - (self.line_starts[-1] == len(self.content))
+
+    def __getitem__(self, index: int) -> str:
+        line_starts = self.line_starts
+        end = line_starts[index + 1] if index + 1 < len(line_starts) else len(self.content)
+        return self.content[line_starts[index] : end]
+
+
+class _LRUCache(OrderedDict):
+    """Dictionary keeping only its most recently used entries."""
+
+    def __init__(self, maxsize: int = _FILE_CACHE_SIZE):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key: Any) -> Any:
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        return default
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+# Analyzer of a worker process of CodeAnalyzer.analyze_files()
+_worker_analyzer: Optional["CodeAnalyzer"] = None
+
+
+def _init_worker(
+    woob_root: str, disk_cache_dir: Optional[Path], woob_files: FrozenSet[str]
+) -> None:
+    """Create the analyzer of a worker process, once per process.
+
+    Args:
+        woob_root: Root path of Woob codebase
+        disk_cache_dir: Directory persisting file analyses across runs, None to disable
+        woob_files: Python files of the Woob codebase, listed by the parent process
+    """
+    global _worker_analyzer
+    _worker_analyzer = CodeAnalyzer(woob_root, disk_cache_dir, woob_files)
+
+
+def _analyze_file(file_path: str) -> Dict[str, Any]:
+    """Analyze a file in a worker process of CodeAnalyzer.analyze_files().
+
+    Args:
+        file_path: Path to Python file
+
+    Returns:
+        Dictionary with all extraction patterns found
+    """
+    return _worker_analyzer._analyze_with_disk_cache(file_path)
+
 
 class CodeAnalyzer:
     """Analyze Python code to extract structure and patterns."""
 
-    def __init__(self, woob_root: Optional[str] = None):
+    def __init__(
+        self,
+        woob_root: Optional[str] = None,
+        disk_cache_dir: Optional[Union[str, Path]] = None,
+        woob_files: Optional[FrozenSet[str]] = None,
+        max_workers: Optional[int] = None,
+    ):
         """Initialize the analyzer.
 
         Args:
             woob_root: Root path of Woob codebase (default: ../woob relative to this file)
+            disk_cache_dir: Directory persisting file analyses across runs
+                (default: no disk cache)
+            woob_files: Python files of the Woob codebase, relative to its root
+                (default: listed from woob_root)
+            max_workers: Maximum number of workers of analyze_files()
+                (default: number of CPUs for processes, 8 for threads)
         """
         if woob_root is None:
             # Default to ../woob relative to the hackathon-ai-poc directory
@@ -25,49 +262,128 @@ class CodeAnalyzer:
             home = os.path.expanduser("~")
             woob_root  / "dev" / "woob"
         self.woob_root = Path(woob_root)
-        print(self.woob_root)
-        self.imports_cache = {}
-        self.classes_cache = {}
+        logger.debug(f"Woob root: {self.woob_root}")
+        # Per-file caches are bounded, to cap memory on long-running processes
+        self.imports_cache: Dict[str, Tuple[List[ImportRec], Dict[str, ImportRec]]] = (
+            _LRUCache()
+        )
+        self.classes_cache: Dict[str, List[ClassRec]] = _LRUCache()
+        self.analysis_cache: Dict[str, Dict[str, Any]] = _LRUCache()
+        self._class_index: Dict[str, Dict[str, ClassRec]] = _LRUCache()
+        self._trace_cache: Dict[
+            Tuple[str, str], Optional[Tuple[Dict[str, Any], Tuple[Tuple[str, str], ...]]]
+        ] = _LRUCache()
+        self._content_cache: Dict[str, Tuple[str, _SourceLines, List[int]]] = _LRUCache()
+        self.disk_cache_dir = Path(disk_cache_dir).expanduser() if disk_cache_dir else None
+        # List the Python files once instead of stat-ing every candidate path
+        if woob_files is None:
+            woob_files = frozenset(
+                p.relative_to(self.woob_root).as_posix() for p in self.woob_root.rglob("*.py")
+            )
+        self._woob_files: FrozenSet[str] = woob_files
+        self.max_workers = max_workers
+
+    def invalidate(self, file_path: str) -> None:
+        """Forget everything cached in memory about a file, e.g. after it changed.
+
+        Args:
+            file_path: Path to Python file
+        """
+        for cache in (
+            self._content_cache,
+            self.imports_cache,
+            self.classes_cache,
+            self._class_index,
+            self.analysis_cache,
+        ):
+            cache.pop(file_path, None)
+
+        # Resolved classes may come from any file
+        self._trace_cache.clear()
+
+    def _is_woob_file(self, file_path: str) -> bool:
+        """Check whether a Python file exists in the Woob codebase.
+
+        Files listed when the analyzer was created are found without any
+        system call. Other paths, e.g. files created since or paths that are
+        not normalized, are checked on disk.
+
+        Args:
+            file_path: Path to Python file, relative to woob_root
+
+        Returns:
+            True if the file exists
+        """
+        return file_path in self._woob_files or (self.woob_root / file_path).is_file()
+
+    def _load(self, file_path: str) -> Optional[Tuple[str, _SourceLines, List[int]]]:
+        """Read a file once and share it between all extractors.
 
-    def extract_imports(self, file_path: str) -> List[Dict[str, str]]:
+        Args:
+            file_path: Path to Python file
+
+        Returns:
+            Tuple of (content, lines, line start offsets) or None if not found
+        """
+        if file_path in self._content_cache:
+            return self._content_cache[file_path]
+
+        if not self._is_woob_file(file_path):
+            return None
+
+        try:
+            with open(self.woob_root / file_path, "r", encoding="utf-8") as f:
+                content = f.read()
+        except FileNotFoundError:
+            # Deleted since the Woob files were listed
+            return None
+        line_starts = _index_lines(content)
+        lines = _SourceLines(content, line_starts)
+
+        self._content_cache[file_path] = content, lines, line_starts
+        return content, lines, line_starts
+
+    def extract_imports(self, file_path: str) -> List[ImportRec]:
         """Extract import statements from a Python file.
 
         Args:
             file_path: Path to Python file
 
         Returns:
-            List of import dictionaries with 'type', 'module', 'name', 'alias'
+            List of ImportRec records with 'type', 'module', 'name', 'alias'
         """
         if file_path in self.imports_cache:
-            return self.imports_cache[file_path]
+            return self.imports_cache[file_path][0]
 
-        full_path = self.woob_root / file_path
-        if not full_path.exists():
+        loaded = self._load(file_path)
+        if loaded is None:
             return []
 
         imports = []
-        with open(full_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        # Handle multi-line imports by normalizing them
-        # Replace newlines inside parentheses with spaces
-        normalized = re.sub(r"\(\s*\n\s*", "(", content)
-        normalized = re.sub(r"\n\s*\)", ")", normalized)
-        normalized = re.sub(r"\n\s*,", ",", normalized)
-
-        # Match: from X import Y [as Z], W [as V], ... (with or without parentheses)
-        from_imports = re.finditer(
-            r"from\s+([\w.]+)\s+import\s+\((.*?)\)|from\s+([\w.]+)\s+import\s+([\w, ]+)",
-            normalized,
-            re.MULTILINE | re.DOTALL,
-        )
-        for match in from_imports:
-            if match.group(1):  # Parenthesized import
-                module = match.group(1)
-                names_str = match.group(2)
+        content = loaded[0]
+
+        # Direct imports are listed after all "from" imports
+        direct_imports = []
+        for match in _RE_IMPORT.finditer(content):
+            module = match.group("direct_module")
+            if module:
+                alias = match.group("direct_alias")
+                direct_imports.append(
+                    ImportRec(
+                        type=_INTERN_IMPORT,
+                        module=sys.intern(module),
+                        name=module.split(".")[-1],
+                        alias=alias or module.split(".")[-1],
+                    )
+                )
+                continue
+
+            if match.group("paren_module"):  # Parenthesized import
+                module = match.group("paren_module")
+                names_str = match.group("paren_names")
             else:  # Regular import
-                module = match.group(3)
-                names_str = match.group(4)
+                module = match.group("from_module")
+                names_str = match.group("from_names")
 
             # Parse individual imports with optional aliases
             for item in names_str.split(","):
@@ -82,119 +398,120 @@ class CodeAnalyzer:
 
                 if name:
                     imports.append(
-                        {
-                            "type": "from",
-                            "module": module,
-                            "name": name,
-                            "alias": alias,
-                        }
+                        ImportRec(
+                            type=_INTERN_FROM,
+                            module=sys.intern(module),
+                            name=name,
+                            alias=alias,
+                        )
                     )
 
-        # Match: import X [as Y]
-        direct_imports = re.finditer(r"^import\s+([\w.]+)(?:\s+as\s+(\w+))?", content, re.MULTILINE)
-        for match in direct_imports:
-            module = match.group(1)
-            alias = match.group(2)
-
-            imports.append(
-                {
-                    "type": "import",
-                    "module": module,
-                    "name": module.split(".")[-1],
-                    "alias": alias or module.split(".")[-1],
-                }
-            )
+        imports.extend(direct_imports)
+
+        # Index by alias, keeping the first import of each alias
+        alias_index = {}
+        for imp in imports:
+            alias_index.setdefault(imp.alias, imp)
 
-        self.imports_cache[file_path] = imports
+        self.imports_cache[file_path] = imports, alias_index
         logger.debug(f"Extracted {len(imports)} imports from {file_path}")
         return imports
 
-    def extract_classes(self, file_path: str) -> List[Dict[str, Any]]:
+    def _get_import_aliases(self, file_path: str) -> Dict[str, ImportRec]:
+        """Get the imports of a Python file indexed by their alias.
+
+        Args:
+            file_path: Path to Python file
+
+        Returns:
+            Dictionary mapping each imported alias to its import record
+        """
+        if file_path not in self.imports_cache:
+            self.extract_imports(file_path)
+
+        cached = self.imports_cache.get(file_path)
+        return cached[1] if cached else {}
+
+    def extract_classes(self, file_path: str) -> List[ClassRec]:
         """Extract class definitions from a Python file.
 
         Args:
             file_path: Path to Python file
 
         Returns:
-            List of class dictionaries with 'name', 'bases', 'line', 'methods'
+            List of ClassRec records with 'name', 'bases', 'line', 'methods'
         """
         if file_path in self.classes_cache:
             return self.classes_cache[file_path]
 
-        full_path = self.woob_root / file_path
-        if not full_path.exists():
+        loaded = self._load(file_path)
+        if loaded is None:
             return []
 
         classes = []
-        with open(full_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-
-        # Match: class ClassName(Base1, Base2):
-        for line_num, line in enumerate(lines, 1):
-            match = re.match(r"^class\s+(\w+)\s*\((.*?)\):", line)
-            if match:
-                class_name = match.group(1)
-                bases_str = match.group(2)
-                bases = [b.strip() for b in bases_str.split(",") if b.strip()]
-
-                # Extract methods
-                methods = self._extract_methods_for_class(lines, line_num)
-
-                classes.append(
-                    {
-                        "name": class_name,
-                        "bases": bases,
-                        "line": line_num,
-                        "methods": methods,
-                    }
+        content, lines, line_starts = loaded
+
+        for match in _RE_CLASS_DEF.finditer(content):
+            line_num = bisect_right(line_starts, match.start())
+            class_name = match.group(1)
+            bases_str = match.group(2)
+            bases = [b.strip() for b in bases_str.split(",") if b.strip()]
+
+            # Extract methods
+            methods = self._extract_methods_for_class(content, lines, line_starts, line_num)
+
+            classes.append(
+                ClassRec(
+                    name=class_name,
+                    bases=bases,
+                    line=line_num,
+                    methods=methods,
                 )
+            )
 
         self.classes_cache[file_path] = classes
         logger.debug(f"Extracted {len(classes)} classes from {file_path}")
         return classes
 
     def _extract_methods_for_class(
-        self, lines: List[str], class_start: int
-    ) -> List[Dict[str, Any]]:
+        self, content: str, lines: _SourceLines, line_starts: List[int], class_start: int
+    ) -> List[MethodRec]:
         """Extract methods from a class definition.
 
         Args:
-            lines: All lines from the file
+            content: Content of the file
+            lines: Lines of the file
+            line_starts: Start offset of each line in content
             class_start: Line number where class starts (1-indexed)
 
         Returns:
-            List of method dictionaries
+            List of MethodRec records
         """
         methods = []
-        class_indent = len(lines[class_start - 1]) - len(lines[class_start - 1].lstrip())
-
-        # Find the end of the class
-        class_end = len(lines)
-        for i in range(class_start, len(lines)):
-            line = lines[i]
-            if line.strip() and not line.startswith(" " * (class_indent + 1)):
-                class_end = i
-                break
-
-        # Extract methods within the class
-        for i in range(class_start, class_end):
-            line = lines[i]
-            match = re.match(r"^\s+def\s+(\w+)\s*\((.*?)\):", line)
-            if match:
-                method_name = match.group(1)
-                params = match.group(2)
-
-                methods.append(
-                    {
-                        "name": method_name,
-                        "line": i + 1,
-                        "params": params,
-                    }
+        if class_start >= len(line_starts):
+            return methods
+
+        class_line = lines[class_start - 1]
+        class_indent = len(class_line) - len(class_line.lstrip())
+
+        # The class ends on the first non-blank line that is not indented deeper
+        body_start = line_starts[class_start]
+        class_end = _class_end_re(class_indent).search(content, body_start)
+        body_end = class_end.start() if class_end else len(content)
+
+        # Extract methods within the class, scanning the class body at once
+        for match in _RE_METHOD_DEF.finditer(content, body_start, body_end):
+            methods.append(
+                MethodRec(
+                    name=match.group(1),
+                    line=bisect_right(line_starts, match.start()),
+                    params=match.group(2),
                 )
+            )
 
         return methods
 
-    def extract_dict_filters(self, file_path: str) -> List[Dict[str, Any]]:
+    def extract_dict_filters(self, file_path: str) -> List[DictFilterRec]:
         """Extract Dict() filter usage from a Python file.
 
         Dict filters are used in Woob to extract fields from JSON responses.
@@ -203,33 +520,33 @@ class CodeAnalyzer:
             file_path: Path to Python file
 
         Returns:
-            List of Dict filter usages with 'path', 'line', 'context'
+            List of DictFilterRec records with 'path', 'line', 'context'
         """
-        full_path = self.woob_root / file_path
-        if not full_path.exists():
+        loaded = self._load(file_path)
+        if loaded is None:
             return []
 
         filters = []
-        with open(full_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-
-        # Match: Dict("path/to/field")
-        for line_num, line in enumerate(lines, 1):
-            matches = re.finditer(r'Dict\s*\(\s*["\']([^"\']+)["\']', line)
-            for match in matches:
-                field_path = match.group(1)
-                filters.append(
-                    {
-                        "path": field_path,
-                        "line": line_num,
-                        "context": line.strip(),
-                    }
+        content, lines, line_starts = loaded
+
+        # Cheap substring test before running the regex over the whole file
+        if "Dict" not in content:
+            return filters
+
+        for match in _RE_DICT_FILTER.finditer(content):
+            line_num = bisect_right(line_starts, match.start())
+            filters.append(
+                DictFilterRec(
+                    path=match.group(1),
+                    line=line_num,
+                    context=lines[line_num - 1].strip(),
                 )
+            )
 
         logger.debug(f"Found {len(filters)} Dict filters in {file_path}")
         return filters
 
-    def extract_obj_methods(self, file_path: str) -> List[Dict[str, Any]]:
+    def extract_obj_methods(self, file_path: str) -> List[ObjMethodRec]:
         """Extract obj_* methods and attributes from a Python file.
 
         obj_* methods and attributes define how fields are extracted and transformed.
@@ -238,57 +555,54 @@ class CodeAnalyzer:
             file_path: Path to Python file
 
         Returns:
-            List of obj_* method/attribute definitions
+            List of ObjMethodRec records for obj_* methods and attributes
         """
-        full_path = self.woob_root / file_path
-        if not full_path.exists():
+        loaded = self._load(file_path)
+        if loaded is None:
             return []
 
         methods = []
-        with open(full_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
+        content, lines, line_starts = loaded
+
+        # Cheap substring test before running the regex over the whole file
+        if "obj_" not in content:
+            return methods
+
+        for match in _RE_OBJ_METHOD_OR_ATTR.finditer(content):
+            line_num = bisect_right(line_starts, match.start())
 
-        for line_num, line in enumerate(lines, 1):
             # Match: def obj_* methods
-            match = re.match(r"^\s+def\s+(obj_\w+)\s*\((.*?)\):", line)
-            if match:
+            if match.group(1):
                 method_name = match.group(1)
                 field_name = method_name[4:]  # Remove 'obj_' prefix
 
-                # Extract the method body (next few lines)
-                body_lines = []
-                indent = len(line) - len(line.lstrip())
-                for i in range(line_num, min(line_num + 20, len(lines))):
-                    body_line = lines[i]
-                    if body_line.strip() and not body_line.startswith(" " * (indent + 1)):
-                        break
-                    body_lines.append(body_line.rstrip())
-
+                body = _method_body(lines, line_num)
                 methods.append(
-                    {
-                        "name": method_name,
-                        "field": field_name,
-                        "line": line_num,
-                        "body": "\n".join(body_lines),
-                        "type": "method",
-                    }
+                    ObjMethodRec(
+                        name=method_name,
+                        field=field_name,
+                        line=line_num,
+                        body=body,
+                        type=_INTERN_METHOD,
+                        dict_filters=_RE_BODY_DICT_FILTER.findall(body),
+                    )
                 )
 
             # Match: obj_* = ... (simple attribute assignment)
-            attr_match = re.match(r"^\s+(obj_\w+)\s*=\s*(.+)$", line)
-            if attr_match:
-                attr_name = attr_match.group(1)
+            else:
+                attr_name = match.group(3)
                 field_name = attr_name[4:]  # Remove 'obj_' prefix
-                attr_value = attr_match.group(2).strip()
+                attr_value = match.group(4).strip()
 
                 methods.append(
-                    {
-                        "name": attr_name,
-                        "field": field_name,
-                        "line": line_num,
-                        "body": attr_value,
-                        "type": "attribute",
-                    }
+                    ObjMethodRec(
+                        name=attr_name,
+                        field=field_name,
+                        line=line_num,
+                        body=attr_value,
+                        type=_INTERN_ATTRIBUTE,
+                        dict_filters=_RE_BODY_DICT_FILTER.findall(attr_value),
+                    )
                 )
 
         logger.debug(f"Found {len(methods)} obj_* methods/attributes in {file_path}")
@@ -314,40 +628,71 @@ class CodeAnalyzer:
             return []
 
         visited.add(class_name)
-        chain = []
-
-        # Find the class in the file
-        classes = self.extract_classes(file_path)
-        for cls in classes:
-            if cls["name"] == class_name:
-                chain.append(
-                    {
-                        "name": class_name,
-                        "file": file_path,
-                        "bases": cls["bases"],
-                        "line": cls["line"],
-                    }
-                )
 
-                # Trace each base class
-                for base in cls["bases"]:
-                    # Try to find the base class in imports
-                    imports = self.extract_imports(file_path)
-                    for imp in imports:
-                        if imp["alias"] == base:
-                            # Resolve the module path
-                            module_path = self._resolve_module_path(imp["module"])
-                            if module_path:
-                                base_chain = self.trace_inheritance(
-                                    module_path, imp["name"], visited
-                                )
-                                chain.extend(base_chain)
-                            break
-
-                break
+        key = (file_path, class_name)
+        if key in self._trace_cache:
+            node = self._trace_cache[key]
+        else:
+            node = self._trace_cache[key] = self._trace_class(file_path, class_name)
+        if node is None:
+            return []
+
+        entry, bases = node
+        chain = [dict(entry)]
+
+        # Trace each base class
+        for module_path, base_name in bases:
+            chain.extend(self.trace_inheritance(module_path, base_name, visited))
 
         return chain
 
+    def _trace_class(
+        self, file_path: str, class_name: str
+    ) -> Optional[Tuple[Dict[str, Any], Tuple[Tuple[str, str], ...]]]:
+        """Resolve a single class of an inheritance chain.
+
+        Memoized per instance in _trace_cache, so that a base class shared by
+        several classes is only resolved once.
+
+        Args:
+            file_path: Path to Python file
+            class_name: Name of the class to resolve
+
+        Returns:
+            Tuple of (chain entry, (module path, class name) of each resolved
+            base class), or None if the class is not defined in the file
+        """
+        if file_path not in self._class_index:
+            # Keep the first definition, as a linear scan would
+            self._class_index[file_path] = {
+                cls.name: cls for cls in reversed(self.extract_classes(file_path))
+            }
+
+        cls = self._class_index[file_path].get(class_name)
+        if cls is None:
+            return None
+
+        entry = {
+            "name": class_name,
+            "file": file_path,
+            "bases": cls.bases,
+            "line": cls.line,
+        }
+
+        bases = []
+        for base in cls.bases:
+            # Try to find the base class in imports
+            imp = self._get_import_aliases(file_path).get(base)
+            if imp is None:
+                continue
+
+            # Resolve the module path
+            module_path = self._resolve_module_path(imp.module)
+            if module_path:
+                bases.append((module_path, imp.name))
+
+        return entry, tuple(bases)
+
     def _resolve_module_path(self, module_name: str) -> Optional[str]:
         """Resolve a module name to a file path.
 
@@ -362,20 +707,19 @@ class CodeAnalyzer:
             return None
 
         # Convert module name to path
-        parts = module_name.split(".")
-        path = self.woob_root / "/".join(parts)
+        rel_path = module_name.replace(".", "/")
 
         # Try as package
-        if (path / "__init__.py").exists():
-            return str(path / "__init__.py").replace(str(self.woob_root) + "/", "")
+        if self._is_woob_file(f"{rel_path}/__init__.py"):
+            return f"{rel_path}/__init__.py"
 
         # Try as module
-        if (path.parent / f"{parts[-1]}.py").exists():
-            return str(path.parent / f"{parts[-1]}.py").replace(str(self.woob_root) + "/", "")
+        if self._is_woob_file(f"{rel_path}.py"):
+            return f"{rel_path}.py"
 
         return None
 
-    def extract_url_endpoints(self, file_path: str) -> List[Dict[str, Any]]:
+    def extract_url_endpoints(self, file_path: str) -> List[EndpointRec]:
         """Extract URL endpoint definitions from a browser file.
 
         URL endpoints are typically defined as: endpoint_name = URL(r"pattern", PageClass)
@@ -384,48 +728,372 @@ class CodeAnalyzer:
             file_path: Path to Python file
 
         Returns:
-            List of URL endpoint definitions with 'name', 'pattern', 'page_class', 'line'
+            List of EndpointRec records with 'name', 'pattern', 'page_class', 'line'
         """
-        full_path = self.woob_root / file_path
-        if not full_path.exists():
+        loaded = self._load(file_path)
+        if loaded is None:
             return []
 
         endpoints = []
-        with open(full_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-
-        # Match: endpoint_name = URL(r"pattern", PageClass)
-        for line_num, line in enumerate(lines, 1):
-            match = re.search(r'(\w+)\s*=\s*URL\s*\(\s*r["\']([^"\']+)["\']', line)
-            if match:
-                endpoint_name = match.group(1)
-                pattern = match.group(2)
-                # Try to extract page class
-                page_class_match = re.search(r",\s*(\w+)\s*\)", line)
-                page_class = page_class_match.group(1) if page_class_match else "Unknown"
-
-                endpoints.append(
-                    {
-                        "name": endpoint_name,
-                        "pattern": pattern,
-                        "page_class": page_class,
-                        "line": line_num,
-                        "context": line.strip(),
-                    }
+        content, lines, line_starts = loaded
+
+        # Cheap substring test before running the regex over the whole file
+        if "URL" not in content:
+            return endpoints
+
+        # Only the first endpoint definition of each line is kept
+        last_line_num = 0
+        search_page_class = _RE_PAGE_CLASS.search
+        for match in _RE_URL_ENDPOINT.finditer(content):
+            line_num = bisect_right(line_starts, match.start())
+            if line_num == last_line_num:
+                continue
+            last_line_num = line_num
+
+            line = lines[line_num - 1]
+            endpoint_name = match.group(1)
+            pattern = match.group(2)
+            # Try to extract page class
+            page_class_match = search_page_class(line)
+            page_class = page_class_match.group(1) if page_class_match else "Unknown"
+
+            endpoints.append(
+                EndpointRec(
+                    name=endpoint_name,
+                    pattern=pattern,
+                    page_class=page_class,
+                    line=line_num,
+                    context=line.strip(),
                 )
+            )
 
         logger.debug(f"Found {len(endpoints)} URL endpoints in {file_path}")
         return endpoints
 
+    def _ast_extract(self, file_path: str) -> Optional[
+        Tuple[
+            List[ImportRec],
+            List[ClassRec],
+            List[DictFilterRec],
+            List[ObjMethodRec],
+            List[EndpointRec],
+        ]
+    ]:
+        """Extract all patterns of a file from a single walk of its syntax tree.
+
+        Unlike the regex based extractors, this sees multi-line statements and
+        ignores comments and strings. Records are the same as theirs, in
+        source order, with "from" imports listed before direct imports.
+
+        Args:
+            file_path: Path to Python file
+
+        Returns:
+            Tuple of (imports, classes, dict_filters, obj_methods, url_endpoints),
+            or None if the file does not exist or cannot be parsed
+        """
+        loaded = self._load(file_path)
+        if loaded is None:
+            return None
+
+        content, lines, _ = loaded
+        try:
+            tree = ast.parse(content, filename=file_path)
+        except (SyntaxError, ValueError) as e:
+            logger.debug(f"Cannot parse {file_path}, falling back to regexes: {e}")
+            return None
+
+        imports = []
+        direct_imports = []
+        classes = []
+        dict_filters = []
+        obj_methods = []
+        url_endpoints = []
+
+        # Like the regexes, only report top-level classes and indented obj_*
+        top_level = {id(node) for node in tree.body}
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef):
+                classes.append(
+                    ClassRec(
+                        name=node.name,
+                        bases=[ast.unparse(base) for base in node.bases],
+                        line=node.lineno,
+                        methods=[
+                            MethodRec(
+                                name=item.name,
+                                line=item.lineno,
+                                params=ast.unparse(item.args),
+                            )
+                            for item in node.body
+                            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))
+                        ],
+                    )
+                )
+
+        # Depth-first walk, which visits nodes in source order
+        stack = [tree]
+        while stack:
+            node = stack.pop()
+            stack.extend(reversed(list(ast.iter_child_nodes(node))))
+
+            if isinstance(node, ast.ImportFrom):
+                module = "." * node.level + (node.module or "")
+                for alias in node.names:
+                    if alias.name != "*":
+                        imports.append(
+                            ImportRec(
+                                type=_INTERN_FROM,
+                                module=sys.intern(module),
+                                name=alias.name,
+                                alias=alias.asname or alias.name,
+                            )
+                        )
+
+            elif isinstance(node, ast.Import):
+                for alias in node.names:
+                    name = alias.name.split(".")[-1]
+                    direct_imports.append(
+                        ImportRec(
+                            type=_INTERN_IMPORT,
+                            module=sys.intern(alias.name),
+                            name=name,
+                            alias=alias.asname or name,
+                        )
+                    )
+
+            elif isinstance(node, ast.Call):
+                if _call_name(node) == "Dict":
+                    path = _first_str_arg(node)
+                    if path:
+                        dict_filters.append(
+                            DictFilterRec(
+                                path=path,
+                                line=node.lineno,
+                                context=lines[node.lineno - 1].strip(),
+                            )
+                        )
+
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                if node.name.startswith("obj_") and id(node) not in top_level:
+                    body = _method_body(lines, node.lineno)
+                    obj_methods.append(
+                        ObjMethodRec(
+                            name=node.name,
+                            field=node.name[4:],  # Remove 'obj_' prefix
+                            line=node.lineno,
+                            body=body,
+                            type=_INTERN_METHOD,
+                            dict_filters=_RE_BODY_DICT_FILTER.findall(body),
+                        )
+                    )
+
+            elif isinstance(node, ast.Assign):
+                line = lines[node.lineno - 1]
+                for target in node.targets:
+                    if not isinstance(target, ast.Name):
+                        continue
+
+                    if target.id.startswith("obj_") and id(node) not in top_level:
+                        body = line.partition("=")[2].strip()
+                        obj_methods.append(
+                            ObjMethodRec(
+                                name=target.id,
+                                field=target.id[4:],  # Remove 'obj_' prefix
+                                line=node.lineno,
+                                body=body,
+                                type=_INTERN_ATTRIBUTE,
+                                dict_filters=_RE_BODY_DICT_FILTER.findall(body),
+                            )
+                        )
+
+                    value = node.value
+                    if isinstance(value, ast.Call) and _call_name(value) == "URL":
+                        pattern = _first_str_arg(value)
+                        if not pattern:
+                            continue
+
+                        # The page class is the last positional argument
+                        page_class = "Unknown"
+                        if len(value.args) > 1:
+                            last_arg = value.args[-1]
+                            if isinstance(last_arg, (ast.Name, ast.Attribute)):
+                                page_class = ast.unparse(last_arg)
+
+                        url_endpoints.append(
+                            EndpointRec(
+                                name=target.id,
+                                pattern=pattern,
+                                page_class=page_class,
+                                line=node.lineno,
+                                context=line.strip(),
+                            )
+                        )
+
+        imports.extend(direct_imports)
+
+        return imports, classes, dict_filters, obj_methods, url_endpoints
+
+    def analyze_files(
+        self, file_paths: List[str], use_threads: bool = False
+    ) -> Dict[str, Dict[str, Any]]:
+        """Analyze all extraction patterns in several files in parallel.
+
+        Files are analyzed in worker processes, or threads, and the results
+        are kept in this analyzer so that analyze_extraction_patterns() reuses
+        them.
+
+        Args:
+            file_paths: Paths to Python files
+            use_threads: Whether to use worker threads, each with its own
+                analyzer, rather than processes
+
+        Returns:
+            Dictionary mapping each file path to its analysis
+        """
+        results = {}
+        pending = []
+        for path in dict.fromkeys(file_paths):
+            if path in self.analysis_cache:
+                results[path] = self.analysis_cache[path]
+            else:
+                pending.append(path)
+
+        # Starting workers is not worth it for a single file
+        if len(pending) > 1 and self.max_workers != 1:
+            if use_threads:
+                worker = self._thread_worker()
+                max_workers = min(self.max_workers or 8, len(pending))
+                executor = ThreadPoolExecutor(max_workers=max_workers)
+            else:
+                worker = _analyze_file
+                max_workers = min(self.max_workers or os.cpu_count() or 1, len(pending))
+                # Send the listing of Woob files once per process, not per file
+                executor = ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_worker,
+                    initargs=(str(self.woob_root), self.disk_cache_dir, self._woob_files),
+                )
+            with executor:
+                for path, result in zip(pending, executor.map(worker, pending, chunksize=8)):
+                    self.analysis_cache[path] = results[path] = result
+        else:
+            for path in pending:
+                self.analysis_cache[path] = results[path] = self._analyze_with_disk_cache(path)
+
+        # Callers may add keys to the results, keep the cached ones untouched
+        return {path: dict(results[path]) for path in file_paths}
+
+    def _thread_worker(self) -> Callable[[str], Dict[str, Any]]:
+        """Get a function analyzing files from worker threads.
+
+        Caches of an analyzer are not thread-safe, so each thread uses its own
+        analyzer, sharing the listing of Woob files of this one.
+
+        Returns:
+            Function taking a file path and returning its analysis
+        """
+        local = threading.local()
+
+        def worker(file_path: str) -> Dict[str, Any]:
+            analyzer = getattr(local, "analyzer", None)
+            if analyzer is None:
+                analyzer = local.analyzer = CodeAnalyzer(
+                    self.woob_root, self.disk_cache_dir, self._woob_files
+                )
+            return analyzer._analyze_with_disk_cache(file_path)
+
+        return worker
+
     def analyze_extraction_patterns(self, file_path: str) -> Dict[str, Any]:
         """Analyze all extraction patterns in a file.
 
+        Results are kept in memory, and persisted in disk_cache_dir if set,
+        keyed by file path, where they are reused as long as the file
+        modification time and size are unchanged.
+
+        Args:
+            file_path: Path to Python file
+
+        Returns:
+            Dictionary with all extraction patterns found
+        """
+        if file_path not in self.analysis_cache:
+            self.analysis_cache[file_path] = self._analyze_with_disk_cache(file_path)
+
+        # Callers may add keys to the result, keep the cached one untouched
+        return dict(self.analysis_cache[file_path])
+
+    def _analyze_with_disk_cache(self, file_path: str) -> Dict[str, Any]:
+        """Analyze all extraction patterns in a file, through the disk cache.
+
+        Args:
+            file_path: Path to Python file
+
+        Returns:
+            Dictionary with all extraction patterns found
+        """
+        if self.disk_cache_dir is None:
+            return self._analyze_extraction_patterns(file_path)
+
+        full_path = self.woob_root / file_path
+        try:
+            stat = full_path.stat()
+        except OSError:
+            return self._analyze_extraction_patterns(file_path)
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        key = f"{_DISK_CACHE_VERSION}:{full_path.resolve()}"
+        cache_file = self.disk_cache_dir / f"{hashlib.sha1(key.encode()).hexdigest()}.pkl"
+
+        try:
+            with open(cache_file, "rb") as f:
+                cached_signature, result = pickle.load(f)
+            if cached_signature == signature:
+                logger.debug(f"Using disk cached analysis for {file_path}")
+                result["file"] = sys.intern(file_path)
+                return result
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable analysis cache for {file_path}: {e}")
+
+        result = self._analyze_extraction_patterns(file_path)
+
+        try:
+            self.disk_cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_file, "wb") as f:
+                pickle.dump((signature, result), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.debug(f"Failed to write analysis cache for {file_path}: {e}")
+
+        return result
+
+    def _analyze_extraction_patterns(self, file_path: str) -> Dict[str, Any]:
+        """Analyze all extraction patterns in a file, without the disk cache.
+
         Args:
             file_path: Path to Python file
 
         Returns:
             Dictionary with all extraction patterns found
         """
+        file_path = sys.intern(file_path)
+        extracted = self._ast_extract(file_path)
+        if extracted is not None:
+            imports, classes, dict_filters, obj_methods, url_endpoints = extracted
+            return {
+                "file": file_path,
+                "imports": imports,
+                "classes": classes,
+                "dict_filters": dict_filters,
+                "obj_methods": obj_methods,
+                "url_endpoints": url_endpoints,
+            }
+
+        # Missing or unparsable file: the regex extractors are more lenient
         return {
             "file": file_path,
             "imports": self.extract_imports(file_path),
@@ -1,7 +1,17 @@
 """Format analysis context for LLM consumption."""
 
 import json
-from typing import Any, Dict
+from operator import itemgetter
+from typing import Any, Dict, List, Tuple, Union
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+_HTTP_METHODS = frozenset({"get", "post", "put", "delete", "patch"})
 
 
 class ContextFormatter:
@@ -22,7 +32,10 @@ class ContextFormatter:
         field_mapping = explorer_result["field_mapping"]
         parent_analysis = explorer_result["parent_analysis"]
 
-        output = f"""# Woob Implementation Analysis
+        parts: List[str] = []
+        append = parts.append
+        append(
+            f"""# Woob Implementation Analysis
 
 ## Module: {module}
 
@@ -35,132 +48,149 @@ class ContextFormatter:
 The following fields are being extracted from the API responses:
 
 """
-
-        # Group fields by source
-        main_fields = [
-            (name, info) for name, info in field_mapping.items() if info.get("source") == "main"
-        ]
-        parent_fields = [
-            (name, info) for name, info in field_mapping.items() if info.get("source") == "parent"
-        ]
+        )
+
+        # Group fields by source, in a single pass
+        main_fields = []
+        parent_fields = []
+        for item in field_mapping.items():
+            source = item[1].get("source")
+            if source == "main":
+                main_fields.append(item)
+            elif source == "parent":
+                parent_fields.append(item)
+
+        # Field names are unique, so sorting on them alone is enough
+        by_name = itemgetter(0)
+        main_fields.sort(key=by_name)
+        parent_fields.sort(key=by_name)
 
         if main_fields:
-            output += "#### From Main Module (cragr_stet):\n"
-            for field_name, info in sorted(main_fields):
+            append("#### From Main Module (cragr_stet):\n")
+            for field_name, info in main_fields:
                 field_type = info.get("type", "unknown")
-                output += f"- `{field_name}` ({field_type})\n"
+                append(f"- `{field_name}` ({field_type})\n")
                 if info.get("body"):
                     body = info.get("body", "").strip()
                     if body and body != "N/A":
-                        output += f"  - Extraction: {body[:100]}\n"
+                        append(f"  - Extraction: {body[:100]}\n")
                 if info.get("path"):
-                    output += f"  - Path: {info.get('path')}\n"
-                output += f"  - Source: {info.get('file', 'unknown')}\n"
-            output += "\n"
+                    append(f"  - Path: {info.get('path')}\n")
+                append(f"  - Source: {info.get('file', 'unknown')}\n")
+            append("\n")
 
         if parent_fields:
-            output += "#### From Parent Classes:\n"
-            for field_name, info in sorted(parent_fields):
+            append("#### From Parent Classes:\n")
+            for field_name, info in parent_fields:
                 field_type = info.get("type", "unknown")
                 parent = info.get("parent", "unknown")
-                output += f"- `{field_name}` ({field_type}) from {parent}\n"
+                append(f"- `{field_name}` ({field_type}) from {parent}\n")
                 # Show extraction method if available
                 if info.get("body"):
                     body = info.get("body", "").strip()
                     if body and body != "N/A":
-                        output += f"  - Extraction: {body[:100]}\n"
+                        append(f"  - Extraction: {body[:100]}\n")
                 if info.get("path"):
-                    output += f"  - Path: {info.get('path')}\n"
-            output += "\n"
+                    append(f"  - Path: {info.get('path')}\n")
+            append("\n")
 
         # Add browser implementation details
         if explorer_result["main_analysis"].get("browser_classes"):
-            output += "### Browser Implementation (Endpoint Definitions)\n\n"
+            append("### Browser Implementation (Endpoint Definitions)\n\n")
             browser_file = explorer_result["main_analysis"].get("browser_file", "browser.py")
-            output += f"File: {browser_file}\n\n"
+            append(f"File: {browser_file}\n\n")
 
             browser_classes = explorer_result["main_analysis"].get("browser_classes", [])
             if browser_classes:
-                output += "#### Classes:\n"
+                append("#### Classes:\n")
                 for cls in browser_classes:
-                    output += f"- `{cls['name']}` (bases: {', '.join(cls['bases'])})\n"
-                output += "\n"
+                    append(f"- `{cls.name}` (bases: {', '.join(cls.bases)})\n")
+                append("\n")
 
             browser_methods = explorer_result["main_analysis"].get("browser_methods", [])
             if browser_methods:
-                output += "#### Methods:\n"
+                append("#### Methods:\n")
                 for method in browser_methods[:10]:  # Show first 10 methods
-                    output += f"- `{method['name']}`\n"
+                    append(f"- `{method.name}`\n")
                 if len(browser_methods) > 10:
-                    output += f"- ... and {len(browser_methods) - 10} more methods\n"
-                output += "\n"
+                    append(f"- ... and {len(browser_methods) - 10} more methods\n")
+                append("\n")
+
+        # Collect URL endpoint mappings and parent class details in one pass
+        endpoint_parts: List[str] = []
+        parent_sections: List[Tuple[str, List[str]]] = []
+        for parent_key, parent_data in parent_analysis.items():
+            analysis = parent_data["analysis"]
+            browser_analysis = parent_data.get("browser_analysis")
+
+            section = [
+                f"#### {parent_key}\n",
+                f"- Pages File: {parent_data['file']}\n",
+                f"- Classes: {len(analysis['classes'])}\n",
+                f"- obj_* methods/attributes: {len(analysis['obj_methods'])}\n",
+                f"- Dict filters: {len(analysis['dict_filters'])}\n",
+            ]
+
+            # Add browser implementation details if available
+            if browser_analysis:
+                url_endpoints = browser_analysis.get("url_endpoints", [])
+                if url_endpoints:
+                    endpoint_parts.append(f"#### From {parent_key}:\n")
+                    for endpoint in url_endpoints:
+                        endpoint_parts.append(
+                            f"- `{endpoint.name}` → `{endpoint.pattern}` (Page: {endpoint.page_class})\n"
+                        )
+                    endpoint_parts.append("\n")
+
+                section.append(f"- Browser File: {parent_data['browser_file']}\n")
+                section.append(f"- Browser Classes: {len(browser_analysis['classes'])}\n")
+                section.append(f"- Browser Methods: {len(browser_analysis['obj_methods'])}\n")
+
+                # List URL endpoint definitions
+                url_filters = browser_analysis.get("dict_filters")
+                if url_filters:
+                    section.append("- Endpoint URLs:\n")
+                    for url_filter in url_filters[:5]:
+                        section.append(f"  - {url_filter.context[:80]}\n")
+                    if len(url_filters) > 5:
+                        section.append(f"  - ... and {len(url_filters) - 5} more\n")
+
+            section.append("\n")
+            parent_sections.append((parent_key, section))
 
         # Add URL endpoint mappings from parent browser classes
-        if explorer_result.get("parent_analysis"):
-            endpoints_found = False
-            for parent_key, parent_data in explorer_result["parent_analysis"].items():
-                if parent_data.get("browser_analysis"):
-                    browser_analysis = parent_data["browser_analysis"]
-                    url_endpoints = browser_analysis.get("url_endpoints", [])
-                    if url_endpoints and not endpoints_found:
-                        output += "### API Endpoint Implementations (from Parent Browser)\n\n"
-                        endpoints_found = True
-
-                    if url_endpoints:
-                        output += f"#### From {parent_key}:\n"
-                        for endpoint in url_endpoints:
-                            output += f"- `{endpoint['name']}` → `{endpoint['pattern']}` (Page: {endpoint['page_class']})\n"
-                        output += "\n"
+        if endpoint_parts:
+            append("### API Endpoint Implementations (from Parent Browser)\n\n")
+            parts.extend(endpoint_parts)
 
         # Add parent class details
-        if parent_analysis:
-            output += "### Parent Classes\n\n"
-            for parent_key, parent_data in sorted(parent_analysis.items()):
-                output += f"#### {parent_key}\n"
-                output += f"- Pages File: {parent_data['file']}\n"
-                analysis = parent_data["analysis"]
-                output += f"- Classes: {len(analysis['classes'])}\n"
-                output += f"- obj_* methods/attributes: {len(analysis['obj_methods'])}\n"
-                output += f"- Dict filters: {len(analysis['dict_filters'])}\n"
-
-                # Add browser implementation details if available
-                if parent_data.get("browser_analysis"):
-                    browser_analysis = parent_data["browser_analysis"]
-                    output += f"- Browser File: {parent_data['browser_file']}\n"
-                    output += f"- Browser Classes: {len(browser_analysis['classes'])}\n"
-                    output += f"- Browser Methods: {len(browser_analysis['obj_methods'])}\n"
-
-                    # List URL endpoint definitions
-                    if browser_analysis.get("dict_filters"):
-                        output += "- Endpoint URLs:\n"
-                        for url_filter in browser_analysis["dict_filters"][:5]:
-                            output += f"  - {url_filter['context'][:80]}\n"
-                        if len(browser_analysis["dict_filters"]) > 5:
-                            output += (
-                                f"  - ... and {len(browser_analysis['dict_filters']) - 5} more\n"
-                            )
-
-                output += "\n"
-
-        return output
+        if parent_sections:
+            append("### Parent Classes\n\n")
+            for _, section in sorted(parent_sections, key=by_name):
+                parts.extend(section)
+
+        return "".join(parts)
 
     @staticmethod
-    def format_swagger_spec(swagger_content: str, max_lines: int = 100) -> str:
+    def format_swagger_spec(swagger_content: Union[str, bytes], max_lines: int = 100) -> str:
         """Format Swagger spec for LLM (truncated for token efficiency).
 
         Args:
-            swagger_content: Raw Swagger JSON content
+            swagger_content: Raw Swagger JSON content, as text or UTF-8 bytes
             max_lines: Maximum lines to include
 
         Returns:
             Formatted Swagger spec
         """
         try:
-            # Parse JSON to validate and pretty-print
-            spec = json.loads(swagger_content)
+            # Parse JSON (orjson errors subclass json.JSONDecodeError)
+            spec = _json_loads(swagger_content)
 
             # Extract key information
-            output = f"""# Bank API Specification (Swagger/OpenAPI)
+            parts: List[str] = []
+            append = parts.append
+            append(
+                f"""# Bank API Specification (Swagger/OpenAPI)
 
 ## Metadata
 - Title: {spec.get("info", {}).get("title", "Unknown")}
@@ -170,6 +200,7 @@ The following fields are being extracted from the API responses:
 ## Endpoints
 
 """
+            )
 
             # List all endpoints
             paths = spec.get("paths", {})
@@ -177,32 +208,32 @@ The following fields are being extracted from the API responses:
                 for method, operation in path_item.items():
                     if method.startswith("x-"):
                         continue
-                    if method not in {"get", "post", "put", "delete", "patch"}:
+                    if method not in _HTTP_METHODS:
                         continue
 
                     summary = operation.get("summary", "")
-                    output += f"### {method.upper()} {path}\n"
+                    append(f"### {method.upper()} {path}\n")
                     if summary:
-                        output += f"- Summary: {summary}\n"
-                    output += f"- Operation ID: {operation.get('operationId', 'N/A')}\n"
+                        append(f"- Summary: {summary}\n")
+                    append(f"- Operation ID: {operation.get('operationId', 'N/A')}\n")
 
                     # Response schemas
                     responses = operation.get("responses", {})
                     if responses:
-                        output += "- Response codes: "
-                        output += ", ".join(sorted(responses.keys()))
-                        output += "\n"
+                        append("- Response codes: ")
+                        append(", ".join(sorted(responses.keys())))
+                        append("\n")
 
-                    output += "\n"
+                    append("\n")
 
             # Add schemas section
-            output += "## Response Schemas\n\n"
+            append("## Response Schemas\n\n")
             schemas = spec.get("components", {}).get("schemas", {})
             for schema_name, schema_def in sorted(schemas.items()):
                 properties = schema_def.get("properties", {})
                 if properties:
-                    output += f"### {schema_name}\n"
-                    output += "Properties:\n"
+                    append(f"### {schema_name}\n")
+                    append("Properties:\n")
                     for prop_name, prop_def in sorted(properties.items()):
                         prop_type = prop_def.get("type", "unknown")
                         required = (
@@ -210,28 +241,34 @@ The following fields are being extracted from the API responses:
                             if prop_name in schema_def.get("required", [])
                             else "optional"
                         )
-                        output += f"- `{prop_name}` ({prop_type}) - {required}\n"
-                    output += "\n"
+                        append(f"- `{prop_name}` ({prop_type}) - {required}\n")
+                    append("\n")
 
-            return output
+            return "".join(parts)
 
         except json.JSONDecodeError as e:
+            if isinstance(swagger_content, bytes):
+                swagger_content = swagger_content.decode("utf-8", errors="replace")
             return f"Error parsing Swagger spec: {e}\n\nRaw content (first 1000 chars):\n{swagger_content[:1000]}"
 
     @staticmethod
-    def format_comparison_context(swagger_content: str, woob_analysis: Dict[str, Any]) -> str:
+    def format_comparison_context(
+        swagger_content: Union[str, bytes], woob_analysis: Dict[str, Any]
+    ) -> str:
         """Format complete context for LLM analysis.
 
         Args:
-            swagger_content: Raw Swagger JSON
+            swagger_content: Raw Swagger JSON, as text or UTF-8 bytes
             woob_analysis: Woob explorer results
 
         Returns:
             Complete formatted context
         """
-        context = "# Gap Analysis Context\n\n"
-        context += ContextFormatter.format_swagger_spec(swagger_content)
-        context += "\n---\n\n"
-        context += ContextFormatter.format_woob_analysis(woob_analysis)
-
-        return context
+        return "".join(
+            (
+                "# Gap Analysis Context\n\n",
+                ContextFormatter.format_swagger_spec(swagger_content),
+                "\n---\n\n",
+                ContextFormatter.format_woob_analysis(woob_analysis),
+            )
+        )
@@ -1,8 +1,10 @@
 """Orchestrator for exploring Woob modules and understanding implementations."""
 
 import logging
+import os
+import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from .code_analyzer import CodeAnalyzer
 
@@ -12,11 +14,20 @@ logger = logging.getLogger(__name__)
 class ModuleExplorer:
     """Explore a Woob module to understand its implementation."""
 
-    def __init__(self, woob_root: Optional[str] = None):
+    def __init__(
+        self,
+        woob_root: Optional[str] = None,
+        workers: Optional[int] = None,
+        disk_cache_dir: Optional[Union[str, Path]] = None,
+    ):
         """Initialize the explorer.
 
         Args:
             woob_root: Root path of Woob codebase (default: ../woob relative to this file)
+            workers: Maximum number of workers analyzing files concurrently,
+                1 to analyze them sequentially (default: automatic)
+            disk_cache_dir: Directory persisting file analyses across runs
+                (default: no disk cache)
         """
         if woob_root is None:
             # Default to ../woob relative to the hackathon-ai-poc directory
@@ -27,8 +38,46 @@ class ModuleExplorer:
         home = os.path.expanduser("~")
         woob_root = Path(home) / "dev" / "woob"
         self.woob_root = woob_root
-        self.code_analyzer = CodeAnalyzer(woob_root)
+        self.code_analyzer = CodeAnalyzer(
+            woob_root, disk_cache_dir=disk_cache_dir, max_workers=workers
+        )
         self.analysis_cache = {}
+        self._resolve_cache: Dict[str, Optional[str]] = {}
+        # File analyses, with the modification time of the analyzed file
+        self._file_cache: Dict[str, Tuple[Optional[int], Dict[str, Any]]] = {}
+        # Browser files found missing next to parent pages files
+        self._missing_files: Set[str] = set()
+        # Parent classes traced from each parent file, with the analysis used
+        self._parent_classes_cache: Dict[str, Tuple[Dict[str, Any], List[Dict[str, Any]]]] = {}
+        # Entries of the directories looked up, by path relative to woob_root
+        self._dir_listing_cache: Dict[str, Dict[str, os.DirEntry]] = {}
+
+    def _analyze(self, file_path: str) -> Dict[str, Any]:
+        """Analyze extraction patterns of a file, reusing the previous analysis.
+
+        The analysis is reused across modules as long as the file modification
+        time is unchanged. It is shared, so it must not be modified.
+
+        Args:
+            file_path: Path to Python file
+
+        Returns:
+            Dictionary with all extraction patterns found
+        """
+        try:
+            mtime = (self.woob_root / file_path).stat().st_mtime_ns
+        except OSError:
+            mtime = None
+
+        cached = self._file_cache.get(file_path)
+        if cached is not None:
+            if cached[0] == mtime:
+                return cached[1]
+            self.code_analyzer.invalidate(file_path)
+
+        analysis = self.code_analyzer.analyze_extraction_patterns(file_path)
+        self._file_cache[file_path] = mtime, analysis
+        return analysis
 
     def explore_module(self, module_name: str) -> Dict[str, Any]:
         """Explore a Woob module to understand its implementation.
@@ -50,12 +99,13 @@ class ModuleExplorer:
         # Step 1: Analyze the main pages.py file
         logger.info("Step 1: Analyzing main implementation file")
         pages_path = f"{module_path}/pages.py"
-        main_analysis = self.code_analyzer.analyze_extraction_patterns(pages_path)
+        # Copied, as browser details are merged into it below
+        main_analysis = dict(self._analyze(pages_path))
 
         # Step 1b: Analyze browser.py for endpoint implementations
         logger.info("Step 1b: Analyzing browser implementation file")
         browser_path = f"{module_path}/browser.py"
-        browser_analysis = self.code_analyzer.analyze_extraction_patterns(browser_path)
+        browser_analysis = self._analyze(browser_path)
         # Merge browser analysis with main analysis
         main_analysis["browser_file"] = browser_path
         main_analysis["browser_classes"] = browser_analysis.get("classes", [])
@@ -103,20 +153,22 @@ class ModuleExplorer:
         """
         parent_classes = []
 
+        # Index imports by alias, keeping the first import of each alias
+        imports_by_alias = {imp.alias: imp for imp in reversed(analysis["imports"])}
+
         for cls in analysis["classes"]:
-            for base in cls["bases"]:
+            for base in cls.bases:
                 # Find the import for this base
-                for imp in analysis["imports"]:
-                    if imp["alias"] == base:
-                        parent_classes.append(
-                            {
-                                "child_class": cls["name"],
-                                "parent_class": imp["name"],
-                                "parent_module": imp["module"],
-                                "import_type": imp["type"],
-                            }
-                        )
-                        break
+                imp = imports_by_alias.get(base)
+                if imp:
+                    parent_classes.append(
+                        {
+                            "child_class": cls.name,
+                            "parent_class": imp.name,
+                            "parent_module": imp.module,
+                            "import_type": imp.type,
+                        }
+                    )
 
         logger.debug(f"Found {len(parent_classes)} parent class relationships")
         return parent_classes
@@ -148,40 +200,130 @@ class ModuleExplorer:
             parent_file = self._resolve_parent_file(module_name, parent_class)
 
             if parent_file:
-                logger.debug(f"{'  ' * depth}Analyzing parent: {parent_class} in {parent_file}")
-                analysis = self.code_analyzer.analyze_extraction_patterns(parent_file)
-
-                # Also analyze browser.py if we found pages.py
-                browser_analysis = None
-                if parent_file.endswith("pages.py"):
-                    browser_file = parent_file.replace("pages.py", "browser.py")
-                    try:
-                        browser_analysis = self.code_analyzer.analyze_extraction_patterns(
-                            browser_file
-                        )
-                        logger.debug(f"{'  ' * depth}Also analyzing browser: {browser_file}")
-                    except (FileNotFoundError, ValueError):
-                        pass
-
+                file_analysis = self._analyze_parent_file(parent_file, parent_class, depth)
                 parent_analysis[key] = {
                     "file": parent_file,
-                    "analysis": analysis,
-                    "browser_file": browser_file if browser_analysis else None,
-                    "browser_analysis": browser_analysis,
+                    "analysis": file_analysis["analysis"],
+                    "browser_file": file_analysis["browser_file"],
+                    "browser_analysis": file_analysis["browser_analysis"],
                     "depth": depth,
                 }
 
                 # Recursively analyze this parent's parents
-                grandparent_classes = self._trace_parent_classes(parent_file, analysis)
-                for grandparent in grandparent_classes:
+                for grandparent in file_analysis["parent_classes"]:
                     analyze_parent_recursive(grandparent, depth + 1)
 
+        # Analyze the parent files concurrently, the walk below then reuses them
+        self._prefetch_parents(parent_classes)
+
         # Start recursive analysis for each parent
         for parent_info in parent_classes:
             analyze_parent_recursive(parent_info)
 
         return parent_analysis
 
+    def _prefetch_parents(self, parent_classes: List[Dict[str, Any]]) -> None:
+        """Analyze the files of parent classes ahead of time, level by level.
+
+        Each level of the inheritance graph is analyzed at once by worker
+        threads, so that _analyze_parents() only hits the analyzer caches.
+
+        Args:
+            parent_classes: List of parent class information
+        """
+        visited = set()
+        level = parent_classes
+        while level:
+            parent_files = []
+            files = []
+            for parent_info in level:
+                module_name = parent_info["parent_module"]
+                key = f"{module_name}.{parent_info['parent_class']}"
+                if key in visited:
+                    continue
+                visited.add(key)
+
+                parent_file = self._resolve_parent_file(module_name, parent_info["parent_class"])
+                if not parent_file:
+                    continue
+                parent_files.append(parent_file)
+                files.append(parent_file)
+
+                if parent_file.endswith("pages.py"):
+                    browser_file = parent_file.replace("pages.py", "browser.py")
+                    if browser_file in self._missing_files:
+                        continue
+                    if self._is_file(browser_file):
+                        files.append(browser_file)
+                    else:
+                        self._missing_files.add(browser_file)
+
+            files = [path for path in dict.fromkeys(files) if path not in self._file_cache]
+            try:
+                analyses = self.code_analyzer.analyze_files(files, use_threads=True)
+            except ValueError:  # e.g. a file that is not valid UTF-8
+                # Leave these files to the sequential walk, which handles them
+                logger.debug(f"Could not analyze parent files ahead: {files}")
+                return
+
+            level = []
+            for parent_file in dict.fromkeys(parent_files):
+                if parent_file in analyses:
+                    analysis = analyses[parent_file]
+                else:
+                    analysis = self._file_cache[parent_file][1]
+                level.extend(self._trace_parent_classes(parent_file, analysis))
+
+    def _analyze_parent_file(
+        self, parent_file: str, parent_class: str, depth: int
+    ) -> Dict[str, Any]:
+        """Analyze a parent file, its browser file and the parents of its classes.
+
+        Args:
+            parent_file: Path to the parent Python file
+            parent_class: Name of the parent class that led to this file
+            depth: Depth of the parent class in the inheritance graph
+
+        Returns:
+            Dictionary with the file analysis, its browser file and analysis,
+            and the parent classes of its classes
+        """
+        logger.debug(f"{'  ' * depth}Analyzing parent: {parent_class} in {parent_file}")
+        analysis = self._analyze(parent_file)
+
+        # Also analyze browser.py if we found pages.py
+        browser_file = None
+        browser_analysis = None
+        if parent_file.endswith("pages.py"):
+            browser_file = parent_file.replace("pages.py", "browser.py")
+            if browser_file in self._missing_files:
+                browser_file = None
+            elif not self._is_file(browser_file):
+                self._missing_files.add(browser_file)
+                browser_file = None
+
+        if browser_file is not None:
+            try:
+                browser_analysis = self._analyze(browser_file)
+                logger.debug(f"{'  ' * depth}Also analyzing browser: {browser_file}")
+            except ValueError:  # e.g. a file that is not valid UTF-8
+                pass
+
+        # Trace parents again only if the file was analyzed again
+        cached = self._parent_classes_cache.get(parent_file)
+        if cached is not None and cached[0] is analysis:
+            parent_classes = cached[1]
+        else:
+            parent_classes = self._trace_parent_classes(parent_file, analysis)
+            self._parent_classes_cache[parent_file] = analysis, parent_classes
+
+        return {
+            "analysis": analysis,
+            "browser_file": browser_file if browser_analysis else None,
+            "browser_analysis": browser_analysis,
+            "parent_classes": parent_classes,
+        }
+
     def _resolve_parent_file(self, module_name: str, class_name: str) -> Optional[str]:
         """Resolve the file path for a parent class.
 
@@ -189,6 +331,23 @@ class ModuleExplorer:
             module_name: Module name (e.g., 'woob_modules.stet.pages')
             class_name: Class name
 
+        Returns:
+            File path or None if not found
+        """
+        # The file only depends on the module, misses included
+        if module_name in self._resolve_cache:
+            return self._resolve_cache[module_name]
+
+        resolved = self._find_module_file(module_name)
+        self._resolve_cache[module_name] = resolved
+        return resolved
+
+    def _find_module_file(self, module_name: str) -> Optional[str]:
+        """Find the file of a module on disk.
+
+        Args:
+            module_name: Module name (e.g., 'woob_modules.stet.pages')
+
         Returns:
             File path or None if not found
         """
@@ -204,12 +363,38 @@ class ModuleExplorer:
         ]
 
         for path in possible_paths:
-            full_path = self.woob_root / path
-            if full_path.exists() and full_path.is_file():
+            if self._is_file(path):
                 return path
 
         return None
 
+    def _is_file(self, path: str) -> bool:
+        """Check whether a file exists, listing its directory once.
+
+        Args:
+            path: File path relative to woob_root
+
+        Returns:
+            True if the path is an existing file
+        """
+        dir_path, name = os.path.split(path)
+        entries = self._dir_listing_cache.get(dir_path)
+        if entries is None:
+            try:
+                with os.scandir(self.woob_root / dir_path) as it:
+                    entries = {entry.name: entry for entry in it}
+            except OSError:
+                entries = {}
+            self._dir_listing_cache[dir_path] = entries
+
+        entry = entries.get(name)
+        if entry is None:
+            return False
+        try:
+            return entry.is_file()
+        except OSError:
+            return False
+
     def _build_field_mapping(
         self, main_analysis: Dict[str, Any], parent_analysis: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -224,79 +409,53 @@ class ModuleExplorer:
         """
         field_mapping = {}
 
-        # Process obj_* methods from main file (highest priority)
-        for method in main_analysis["obj_methods"]:
-            field_name = method["field"]
-            field_mapping[field_name] = {
-                "source": "main",
-                "method": method["name"],
-                "line": method["line"],
-                "body": method["body"],
-                "dict_filters": self._extract_dict_filters_from_body(method["body"]),
-                "file": "main",
-            }
-
-        # Process Dict filters from main file
-        for filt in main_analysis["dict_filters"]:
-            if filt["path"] not in field_mapping:
-                field_mapping[filt["path"]] = {
-                    "source": "dict_filter",
-                    "path": filt["path"],
-                    "line": filt["line"],
-                    "context": filt["context"],
-                    "file": "main",
-                }
+        # Main file first (highest priority), then parents in discovery order
+        sources = [(None, main_analysis, "main")]
+        sources.extend(
+            (parent_key, parent_data["analysis"], parent_data["file"])
+            for parent_key, parent_data in parent_analysis.items()
+        )
 
-        # Process parent classes (lower priority - don't override main)
-        for parent_key, parent_data in parent_analysis.items():
-            analysis = parent_data["analysis"]
+        for parent_key, analysis, file in sources:
+            is_main = parent_key is None
 
-            # Process obj_* methods from parent
+            # Process obj_* methods, only main ones may override a field
             for method in analysis["obj_methods"]:
-                field_name = method["field"]
-                if field_name not in field_mapping:
-                    field_mapping[field_name] = {
-                        "source": "parent",
-                        "parent": parent_key,
-                        "method": method["name"],
-                        "line": method["line"],
-                        "body": method["body"],
-                        "dict_filters": self._extract_dict_filters_from_body(method["body"]),
-                        "file": parent_data["file"],
-                    }
-
-            # Process Dict filters from parent
+                # The same few field names are found in every module, and
+                # analyses loaded from the disk cache do not share them
+                field_name = sys.intern(method.field)
+                if not is_main and field_name in field_mapping:
+                    continue
+
+                entry = (
+                    {"source": "main"} if is_main else {"source": "parent", "parent": parent_key}
+                )
+                entry["method"] = method.name
+                entry["line"] = method.line
+                entry["body"] = method.body
+                entry["dict_filters"] = method.dict_filters
+                entry["file"] = file
+                field_mapping[field_name] = entry
+
+            # Process Dict filters
             for filt in analysis["dict_filters"]:
-                if filt["path"] not in field_mapping:
-                    field_mapping[filt["path"]] = {
-                        "source": "parent",
-                        "parent": parent_key,
-                        "path": filt["path"],
-                        "line": filt["line"],
-                        "context": filt["context"],
-                        "file": parent_data["file"],
-                    }
+                path = sys.intern(filt.path)
+                if path in field_mapping:
+                    continue
+
+                entry = (
+                    {"source": "dict_filter"}
+                    if is_main
+                    else {"source": "parent", "parent": parent_key}
+                )
+                entry["path"] = path
+                entry["line"] = filt.line
+                entry["context"] = filt.context
+                entry["file"] = file
+                field_mapping[path] = entry
 
         return field_mapping
 
-    def _extract_dict_filters_from_body(self, body: str) -> List[str]:
-        """Extract Dict filter paths from method body.
-
-        Args:
-            body: Method body as string
-
-        Returns:
-            List of Dict filter paths
-        """
-        import re
-
-        filters = []
-        matches = re.finditer(r'Dict\s*\(\s*["\']([^"\']+)["\']', body)
-        for match in matches:
-            filters.append(match.group(1))
-
-        return filters
-
     def _extract_all_fields(self, field_mapping: Dict[str, Any]) -> List[str]:
         """Extract all unique field names from field mapping.
 
@@ -306,7 +465,7 @@ class ModuleExplorer:
         Returns:
             List of unique field names
         """
-        return sorted(list(field_mapping.keys()))
+        return sorted(field_mapping)
 
     def get_extracted_fields_summary(self, module_name: str) -> Dict[str, Any]:
         """Get a summary of extracted fields for a module.
@@ -323,7 +482,7 @@ class ModuleExplorer:
             "module": module_name,
             "total_fields": len(analysis["extracted_fields"]),
             "fields": analysis["extracted_fields"],
-            "obj_methods": [m["name"] for m in analysis["main_analysis"]["obj_methods"]],
-            "dict_filters": [f["path"] for f in analysis["main_analysis"]["dict_filters"]],
+            "obj_methods": [m.name for m in analysis["main_analysis"]["obj_methods"]],
+            "dict_filters": [f.path for f in analysis["main_analysis"]["dict_filters"]],
             "parent_classes": analysis["parent_classes"],
         }
@@ -1,6 +1,7 @@
 """Generate markdown reports from Bedrock analysis results."""
 
 import logging
+import os
 from datetime import datetime
 from typing import Any, Dict
 
@@ -111,6 +112,10 @@ that may affect data extraction accuracy and completeness.
     def save_report(report: str, output_path: str) -> None:
         """Save report to file.
 
+        The encoded report is written in a single buffer to a temporary file,
+        which then replaces the output file, so that a previous report is
+        never left half overwritten.
+
         Args:
             report: Markdown report content
             output_path: Path to save report to
@@ -118,12 +123,24 @@ that may affect data extraction accuracy and completeness.
         Raises:
             IOError: If file cannot be written
         """
+        data = memoryview(report.encode("utf-8"))
+        # Unique per process, so that concurrent runs never publish each other's writes
+        tmp_path = f"{output_path}.{os.getpid()}.tmp"
         try:
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(report)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            try:
+                while data:
+                    data = data[os.write(fd, data) :]
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, output_path)
             logger.info(f"Report saved to: {output_path}")
         except IOError as e:
             logger.error(f"Failed to save report: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
             raise
 
     @staticmethod
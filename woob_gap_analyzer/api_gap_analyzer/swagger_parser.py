@@ -1,8 +1,44 @@
 """Swagger/OpenAPI specification parser for Bank API analysis."""
 
 import json
+import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Paths of AIS endpoints, related to accounts, balances and transactions
+_AIS_RE = re.compile(r"/(?:accounts|balances|transactions)")
+# Path item keys of operations, leaving out parameters and x- extensions
+_HTTP_METHODS = frozenset({"get", "post", "put", "delete", "patch"})
+# Prefix of references to schemas, which most references are
+_SCHEMA_REF_PREFIX = "#/components/schemas/"
+
+# Kinds of frames on the stack of SwaggerParser._flatten_schema()
+_SCHEMA_FRAME = "schema"
+_PROPERTY_FRAME = "property"
+
+
+def _join_field_name(prefix: str, name: str) -> str:
+    """Get the name of a nested field.
+
+    Args:
+        prefix: Name of the parent field, ending with "[]" for array items
+        name: Name of the field in its parent
+
+    Returns:
+        Full name of the field
+    """
+    if not prefix:
+        return name
+    if prefix.endswith("[]"):
+        return f"{prefix}{name}"
+    return f"{prefix}.{name}"
 
 
 class SwaggerParser:
@@ -18,14 +54,84 @@ class SwaggerParser:
             FileNotFoundError: If spec file doesn't exist
             json.JSONDecodeError: If spec is not valid JSON
         """
-        self.spec_path = Path(spec_path)
+        self.spec_path: Optional[Path] = Path(spec_path)
         if not self.spec_path.exists():
             raise FileNotFoundError(f"Swagger spec not found: {spec_path}")
 
-        with open(self.spec_path, "r", encoding="utf-8") as f:
-            self.spec = json.load(f)
+        # orjson errors are json.JSONDecodeError too
+        self._load_spec(_json_loads(self.spec_path.read_bytes()))
+
+    @classmethod
+    def from_string(cls, content: str, spec_path: Optional[str] = None) -> "SwaggerParser":
+        """Create a parser from the content of a Swagger spec, already read.
+
+        Args:
+            content: Swagger JSON content
+            spec_path: Path the content was read from, if any
+
+        Returns:
+            SwaggerParser instance
+
+        Raises:
+            json.JSONDecodeError: If spec is not valid JSON
+        """
+        return cls._from_json(content, spec_path)
+
+    @classmethod
+    def from_bytes(cls, content: bytes, spec_path: Optional[str] = None) -> "SwaggerParser":
+        """Create a parser from the raw content of a Swagger spec, already read.
+
+        The content is decoded straight from bytes, without building an
+        intermediate string.
+
+        Args:
+            content: Swagger JSON content, encoded in UTF-8
+            spec_path: Path the content was read from, if any
+
+        Returns:
+            SwaggerParser instance
+
+        Raises:
+            json.JSONDecodeError: If spec is not valid JSON
+        """
+        return cls._from_json(content, spec_path)
+
+    @classmethod
+    def _from_json(
+        cls, content: Union[str, bytes], spec_path: Optional[str] = None
+    ) -> "SwaggerParser":
+        """Create a parser from Swagger JSON content.
+
+        Args:
+            content: Swagger JSON content
+            spec_path: Path the content was read from, if any
+
+        Returns:
+            SwaggerParser instance
+        """
+        parser = cls.__new__(cls)
+        parser.spec_path = Path(spec_path) if spec_path is not None else None
+        parser._load_spec(_json_loads(content))
+        return parser
+
+    def _load_spec(self, spec: Dict[str, Any]) -> None:
+        """Set the decoded spec and validate it.
+
+        Args:
+            spec: Decoded Swagger spec
+
+        Raises:
+            ValueError: If spec is missing required sections
+        """
+        self.spec = spec
 
         self._validate_spec()
+        self._schemas: Dict[str, Dict[str, Any]] = self.spec["components"]["schemas"]
+
+        # Built on first use, the spec never changes afterwards
+        self._all_endpoints: Optional[List[Dict[str, Any]]] = None
+        self._by_opid: Optional[Dict[str, Dict[str, Any]]] = None
+        self._ref_cache: Dict[str, Dict[str, Any]] = {}
 
     def _validate_spec(self) -> None:
         """Validate that spec has required Swagger structure."""
@@ -42,62 +148,56 @@ class SwaggerParser:
         Returns:
             List of endpoint dictionaries with path, method, and details
         """
-        ais_keywords = {"/accounts", "/balances", "/transactions"}
-        endpoints = []
-
-        for path, path_item in self.spec.get("paths", {}).items():
-            # Check if this is an AIS endpoint
-            if not any(keyword in path for keyword in ais_keywords):
-                continue
-
-            for method, operation in path_item.items():
-                if method.startswith("x-"):  # Skip vendor extensions
-                    continue
-                if method not in {"get", "post", "put", "delete", "patch"}:
-                    continue
-
-                endpoint = {
-                    "path": path,
-                    "method": method.upper(),
-                    "operationId": operation.get("operationId", ""),
-                    "summary": operation.get("summary", ""),
-                    "description": operation.get("description", ""),
-                    "parameters": operation.get("parameters", []),
-                    "requestBody": operation.get("requestBody"),
-                    "responses": operation.get("responses", {}),
-                }
-                endpoints.append(endpoint)
-
-        return endpoints
+        return [
+            endpoint for endpoint in self.get_all_endpoints() if _AIS_RE.search(endpoint["path"])
+        ]
 
     def get_all_endpoints(self) -> List[Dict[str, Any]]:
         """Extract all endpoints from the spec.
 
         Returns:
-            List of all endpoint dictionaries
+            List of all endpoint dictionaries, a new list on each call
         """
-        endpoints = []
+        if self._all_endpoints is None:
+            self._all_endpoints = list(self._iter_endpoints())
+        # Callers may modify the list, keep the cached one untouched
+        return list(self._all_endpoints)
 
+    def _iter_endpoints(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over the endpoints of the spec, in spec order.
+
+        Yields:
+            Endpoint dictionaries with path, method, and details
+        """
         for path, path_item in self.spec.get("paths", {}).items():
             for method, operation in path_item.items():
-                if method.startswith("x-"):
-                    continue
-                if method not in {"get", "post", "put", "delete", "patch"}:
+                if method not in _HTTP_METHODS:
                     continue
 
-                endpoint = {
-                    "path": path,
-                    "method": method.upper(),
-                    "operationId": operation.get("operationId", ""),
-                    "summary": operation.get("summary", ""),
-                    "description": operation.get("description", ""),
-                    "parameters": operation.get("parameters", []),
-                    "requestBody": operation.get("requestBody"),
-                    "responses": operation.get("responses", {}),
-                }
-                endpoints.append(endpoint)
+                yield self._build_endpoint(path, method, operation)
+
+    @staticmethod
+    def _build_endpoint(path: str, method: str, operation: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the endpoint dictionary of an operation.
+
+        Args:
+            path: Path of the endpoint
+            method: HTTP method, in lower case
+            operation: Operation object from Swagger spec
 
-        return endpoints
+        Returns:
+            Endpoint dictionary with path, method, and details
+        """
+        return {
+            "path": path,
+            "method": method.upper(),
+            "operationId": operation.get("operationId", ""),
+            "summary": operation.get("summary", ""),
+            "description": operation.get("description", ""),
+            "parameters": operation.get("parameters", []),
+            "requestBody": operation.get("requestBody"),
+            "responses": operation.get("responses", {}),
+        }
 
     def get_response_schema(self, endpoint: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Get the response schema for an endpoint.
@@ -155,44 +255,37 @@ class SwaggerParser:
     def _flatten_schema(
         self, schema: Dict[str, Any], prefix: str = "", visited: Optional[Set[str]] = None
     ) -> Dict[str, Any]:
-        """Recursively flatten a schema into field definitions.
+        """Flatten a schema into field definitions.
+
+        Nested fields are named after their parents (e.g. "data.accounts"),
+        and items of arrays get a "[]" suffix (e.g. "accounts[]iban"). The
+        schema is walked depth-first with an explicit stack, so fields come
+        in the same order as with a recursive walk.
+
+        A $ref is only skipped when it is already being expanded on the path
+        from the root, to break cycles: a schema referenced by several
+        properties is expanded under each of them.
 
         Args:
             schema: Schema object to flatten
             prefix: Prefix for nested fields (e.g., "data.accounts")
-            visited: Set of already visited schema refs (to avoid cycles)
+            visited: Schema refs already being expanded (to avoid cycles)
 
         Returns:
             Dictionary of flattened fields
         """
-        if visited is None:
-            visited = set()
-
         fields = {}
 
-        # Handle $ref
-        if "$ref" in schema:
-            ref = schema["$ref"]
-            if ref in visited:
-                return fields
-            visited.add(ref)
-            schema = self._resolve_ref(ref)
-
-        # Handle arrays
-        if schema.get("type") == "array":
-            items_schema = schema.get("items", {})
-            array_fields = self._flatten_schema(items_schema, prefix, visited)
-            for field_name, field_info in array_fields.items():
-                fields[f"{prefix}[]{field_name}" if prefix else f"[]{field_name}"] = field_info
-            return fields
-
-        # Handle objects
-        if schema.get("type") == "object":
-            properties = schema.get("properties", {})
-            required = schema.get("required", [])
-
-            for prop_name, prop_schema in properties.items():
-                field_name = f"{prefix}.{prop_name}" if prefix else prop_name
+        # Frames are either a schema to descend into, or a property to add
+        stack: List[Tuple[Any, ...]] = [
+            (_SCHEMA_FRAME, schema, prefix, frozenset(visited or ()))
+        ]
+        while stack:
+            frame = stack.pop()
+
+            if frame[0] is _PROPERTY_FRAME:
+                _, prop_name, prop_schema, required, prefix, visited = frame
+                field_name = _join_field_name(prefix, prop_name)
                 field_info = {
                     "type": prop_schema.get("type", "unknown"),
                     "required": prop_name in required,
@@ -209,19 +302,58 @@ class SwaggerParser:
 
                 fields[field_name] = field_info
 
-                # Recursively flatten nested objects
-                if prop_schema.get("type") == "object" or "$ref" in prop_schema:
-                    nested_fields = self._flatten_schema(prop_schema, field_name, visited)
-                    fields.update(nested_fields)
-                elif prop_schema.get("type") == "array":
-                    nested_fields = self._flatten_schema(prop_schema, field_name, visited)
-                    fields.update(nested_fields)
+                # Flatten nested objects and arrays
+                if prop_schema.get("type") in ("object", "array") or "$ref" in prop_schema:
+                    stack.append((_SCHEMA_FRAME, prop_schema, field_name, visited))
+                continue
+
+            _, schema, prefix, visited = frame
+
+            # Handle $ref
+            if "$ref" in schema:
+                ref = schema["$ref"]
+                if ref in visited:
+                    continue
+                visited = visited | {ref}
+                schema = self._resolve_ref(ref)
+
+            # Handle arrays
+            if schema.get("type") == "array":
+                items_schema = schema.get("items", {})
+                stack.append((_SCHEMA_FRAME, items_schema, f"{prefix}[]", visited))
+
+            # Handle objects
+            elif schema.get("type") == "object":
+                properties = schema.get("properties", {})
+                required = frozenset(schema.get("required", ()))
+
+                # Pushed in reverse, so that properties are added in order
+                for prop_name, prop_schema in reversed(properties.items()):
+                    stack.append(
+                        (_PROPERTY_FRAME, prop_name, prop_schema, required, prefix, visited)
+                    )
 
         return fields
 
     def _resolve_ref(self, ref: str) -> Dict[str, Any]:
         """Resolve a $ref reference to its schema.
 
+        Args:
+            ref: Reference string (e.g., "#/components/schemas/Account")
+
+        Returns:
+            Resolved schema dictionary
+        """
+        if ref in self._ref_cache:
+            return self._ref_cache[ref]
+
+        resolved = self._resolve_ref_uncached(ref)
+        self._ref_cache[ref] = resolved
+        return resolved
+
+    def _resolve_ref_uncached(self, ref: str) -> Dict[str, Any]:
+        """Resolve a $ref reference to its schema, walking the spec.
+
         Args:
             ref: Reference string (e.g., "#/components/schemas/Account")
 
@@ -231,6 +363,13 @@ class SwaggerParser:
         if not ref.startswith("#/"):
             return {}
 
+        # Fast path for direct references to a schema
+        name = ref[len(_SCHEMA_REF_PREFIX) :]
+        if ref.startswith(_SCHEMA_REF_PREFIX) and "/" not in name:
+            schemas = self._schemas
+            current = schemas.get(name, {}) if isinstance(schemas, dict) else {}
+            return current if isinstance(current, dict) else {}
+
         parts = ref[2:].split("/")
         current = self.spec
 
@@ -251,10 +390,13 @@ class SwaggerParser:
         Returns:
             Endpoint dictionary or None if not found
         """
-        for endpoint in self.get_all_endpoints():
-            if endpoint.get("operationId") == operation_id:
-                return endpoint
-        return None
+        if self._by_opid is None:
+            # Keep the first endpoint of each operationId, as a linear search would
+            self._by_opid = {}
+            for endpoint in self.get_all_endpoints():
+                self._by_opid.setdefault(endpoint["operationId"], endpoint)
+
+        return self._by_opid.get(operation_id)
 
     def get_schema_by_name(self, schema_name: str) -> Optional[Dict[str, Any]]:
         """Get a schema definition by name.
@@ -265,8 +407,7 @@ class SwaggerParser:
         Returns:
             Schema dictionary or None if not found
         """
-        schemas = self.spec.get("components", {}).get("schemas", {})
-        return schemas.get(schema_name)
+        return self._schemas.get(schema_name)
 
     def get_all_schemas(self) -> Dict[str, Dict[str, Any]]:
         """Get all schema definitions.
@@ -274,4 +415,4 @@ class SwaggerParser:
         Returns:
             Dictionary mapping schema names to their definitions
         """
-        return self.spec.get("components", {}).get("schemas", {})
+        return self._schemas
@@ -18,6 +18,9 @@ Usage:
         --module cragr_stet \\
         --output custom_report.md
 
+    # Analyze several modules in a single Bedrock request
+    python woob/dev_tools/compare_scraping.py --module cragr_stet bnp_stet
+
     # Verbose output
     python woob/dev_tools/compare_scraping.py --module cragr_stet -v
 
@@ -26,19 +29,42 @@ Report Location:
     Swagger specs should be placed at: modules/{module}/api-spec/swagger.json
 """
 
+from __future__ import annotations
+
 import argparse
+import hashlib
 import json
 import logging
+import os
+import pickle
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+try:
+    import zstandard
 
-from .api_gap_analyzer.bedrock_client import BedrockAnalyzer
-from .api_gap_analyzer.context_formatter import ContextFormatter
-from .api_gap_analyzer.explorer import ModuleExplorer
-from .api_gap_analyzer.report_generator import ReportGenerator
-from .api_gap_analyzer.swagger_parser import SwaggerParser
-from .api_gap_analyzer.system_prompt import get_system_prompt
+    # Errors of unreadable cached analyses
+    _CACHE_READ_ERRORS = (OSError, ValueError, zstandard.ZstdError)
+except ImportError:
+    zstandard = None
+    _CACHE_READ_ERRORS = (OSError, ValueError)
+
+# The analyzer modules are imported where they are used, so that --help
+# and invalid arguments do not pay for importing them
+if TYPE_CHECKING:
+    from .api_gap_analyzer.explorer import ModuleExplorer
+    from .api_gap_analyzer.swagger_parser import SwaggerParser
+
+# Default directory of cached Bedrock analysis results
+DEFAULT_CACHE_DIR = "~/.cache/woob_gap_analyzer"
+# Cached analyses smaller than this are not worth compressing
+CACHE_COMPRESS_MIN_SIZE = 4096
+# Bump whenever the format of module explorations changes
+EXPLORE_CACHE_VERSION = 1
 
 
 def setup_logging(verbose: bool = False) -> None:
@@ -67,20 +93,21 @@ def resolve_swagger_path(module_name: str, swagger_arg: str = None) -> Path:
     """
     # If swagger argument provided, use it
     if swagger_arg:
-        swagger_path = Path(swagger_arg)
-        if swagger_path.exists():
-            return swagger_path
+        if os.path.isfile(swagger_arg):
+            return Path(swagger_arg)
         raise FileNotFoundError(f"Swagger spec not found: {swagger_arg}")
 
+    module_dir = os.path.join("..", "..", "modules", module_name)
+
     # Try to find api-spec/swagger.json in the module folder
-    module_spec_path = Path("..") / ".." / "modules" / module_name / "api-spec" / "swagger.json"
-    if module_spec_path.exists():
-        return module_spec_path
+    module_spec_path = os.path.join(module_dir, "api-spec", "swagger.json")
+    if os.path.isfile(module_spec_path):
+        return Path(module_spec_path)
 
     # Try the old location (module root)
-    old_spec_path = Path("..") / ".." / "modules" / module_name / "Swagger-DSP2-v1.21.json"
-    if old_spec_path.exists():
-        return old_spec_path
+    old_spec_path = os.path.join(module_dir, "Swagger-DSP2-v1.21.json")
+    if os.path.isfile(old_spec_path):
+        return Path(old_spec_path)
 
     raise FileNotFoundError(
         f"Swagger spec not found. Tried:\n"
@@ -107,15 +134,55 @@ def validate_arguments(args: argparse.Namespace) -> None:
         if not swagger_path.suffix == ".json":
             raise ValueError(f"Swagger spec must be JSON file: {args.swagger}")
 
+    if args.output and len(set(args.module)) > 1:
+        raise ValueError("--output can only be used with a single module")
+
+
+@lru_cache(maxsize=16)
+def _read_swagger_file(swagger_path: str, mtime_ns: int) -> bytes:
+    """Read a Swagger specification file, once per modification time.
+
+    The content is kept as bytes, it is only decoded to text when it is
+    sent to Bedrock.
+
+    Args:
+        swagger_path: Resolved path to Swagger JSON file
+        mtime_ns: Modification time of the file, to reload it on change
+
+    Returns:
+        Raw JSON content, encoded in UTF-8
+    """
+    with open(swagger_path, "rb") as f:
+        return f.read()
+
+
+@lru_cache(maxsize=16)
+def _build_parser(swagger_path: str, mtime_ns: int) -> SwaggerParser:
+    """Parse a Swagger specification file, once per modification time.
+
+    The content read by _read_swagger_file() is parsed, so that the file is
+    only read and decoded once.
+
+    Args:
+        swagger_path: Resolved path to Swagger JSON file
+        mtime_ns: Modification time of the file, to reparse it on change
+
+    Returns:
+        SwaggerParser instance
+    """
+    from .api_gap_analyzer.swagger_parser import SwaggerParser
+
+    return SwaggerParser.from_bytes(_read_swagger_file(swagger_path, mtime_ns), swagger_path)
 
-def load_swagger_spec(swagger_path: str) -> tuple[SwaggerParser, str]:
+
+def load_swagger_spec(swagger_path: str) -> tuple[SwaggerParser, bytes]:
     """Load and parse Swagger specification.
 
     Args:
         swagger_path: Path to Swagger JSON file
 
     Returns:
-        Tuple of (SwaggerParser instance, raw JSON content)
+        Tuple of (SwaggerParser instance, raw JSON content as UTF-8 bytes)
 
     Raises:
         FileNotFoundError: If file doesn't exist
@@ -125,9 +192,11 @@ def load_swagger_spec(swagger_path: str) -> tuple[SwaggerParser, str]:
     logger.info(f"Loading Swagger spec from: {swagger_path}")
 
     try:
-        parser = SwaggerParser(swagger_path)
-        with open(swagger_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        # Loaded specs are reused as long as the file is unchanged
+        resolved_path = str(Path(swagger_path).resolve())
+        mtime_ns = os.stat(resolved_path).st_mtime_ns
+        content = _read_swagger_file(resolved_path, mtime_ns)
+        parser = _build_parser(resolved_path, mtime_ns)
         logger.info("Swagger spec loaded successfully")
         return parser, content
     except FileNotFoundError as e:
@@ -138,15 +207,370 @@ def load_swagger_spec(swagger_path: str) -> tuple[SwaggerParser, str]:
         raise
 
 
-def format_duration(seconds: float) -> str:
-    """Format duration in seconds to human-readable format.
+def timed(func: Callable[..., Any], *args: Any) -> tuple[Any, int]:
+    """Call a function and measure how long it took.
+
+    Args:
+        func: Function to call
+        *args: Arguments of the function
+
+    Returns:
+        Tuple of (function result, duration in nanoseconds)
+    """
+    start = time.perf_counter_ns()
+    result = func(*args)
+    return result, time.perf_counter_ns() - start
+
+
+def load_ais_endpoints(swagger_path: str) -> tuple[SwaggerParser, bytes, list]:
+    """Load a Swagger specification and list its AIS endpoints.
+
+    Args:
+        swagger_path: Path to Swagger JSON file
+
+    Returns:
+        Tuple of (SwaggerParser instance, raw JSON content as UTF-8 bytes, AIS endpoints)
+    """
+    logger = logging.getLogger(__name__)
+    logger.info("Step 1: Loading Swagger specification...")
+    swagger_parser, swagger_content = load_swagger_spec(swagger_path)
+    ais_endpoints = swagger_parser.get_ais_endpoints()
+    logger.info(f"Found {len(ais_endpoints)} AIS endpoints")
+    return swagger_parser, swagger_content, ais_endpoints
+
+
+def explored_files_signature(woob_root: Path, woob_analysis: dict) -> dict[str, Optional[int]]:
+    """Get the modification times of the files a module exploration used.
+
+    Args:
+        woob_root: Root path of Woob codebase
+        woob_analysis: Module analysis from ModuleExplorer
+
+    Returns:
+        Dictionary mapping absolute file paths to their modification time,
+        None for missing files
+    """
+    files = [woob_analysis["main_file"], woob_analysis["main_analysis"]["browser_file"]]
+    for parent_data in woob_analysis["parent_analysis"].values():
+        files.append(parent_data["file"])
+        if parent_data["browser_file"]:
+            files.append(parent_data["browser_file"])
+
+    signature = {}
+    for file in files:
+        path = str(Path(woob_root) / file)
+        try:
+            signature[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            signature[path] = None
+    return signature
+
+
+def load_cached_exploration(cache_dir: Path, module_name: str) -> Optional[dict]:
+    """Load a cached module exploration, if its files are unchanged.
+
+    Args:
+        cache_dir: Directory of cached results
+        module_name: Module name (e.g., 'cragr_stet')
+
+    Returns:
+        Module analysis, or None if it is not cached or outdated
+    """
+    try:
+        with open(cache_dir / f"explore_{module_name}.pkl", "rb") as f:
+            version, signature, woob_analysis = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:  # unpickling may raise about anything
+        logging.getLogger(__name__).warning(f"Ignoring unreadable cached exploration: {e}")
+        return None
+
+    if version != EXPLORE_CACHE_VERSION:
+        return None
+    for path, mtime in signature.items():
+        try:
+            current = os.stat(path).st_mtime_ns
+        except OSError:
+            current = None
+        if current != mtime:
+            return None
+    return woob_analysis
+
+
+def save_cached_exploration(
+    cache_dir: Path, module_name: str, woob_root: Path, woob_analysis: dict
+) -> None:
+    """Save a module exploration in the cache.
+
+    Args:
+        cache_dir: Directory of cached results
+        module_name: Module name (e.g., 'cragr_stet')
+        woob_root: Root path of Woob codebase
+        woob_analysis: Module analysis from ModuleExplorer
+    """
+    signature = explored_files_signature(woob_root, woob_analysis)
+    cache_file = cache_dir / f"explore_{module_name}.pkl"
+    tmp_file = cache_dir / f"explore_{module_name}.{os.getpid()}.tmp"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, "wb") as f:
+            pickle.dump(
+                (EXPLORE_CACHE_VERSION, signature, woob_analysis),
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logging.getLogger(__name__).warning(f"Could not cache exploration: {e}")
+
+
+@lru_cache(maxsize=None)
+def get_explorer(
+    workers: Optional[int] = None, file_cache_dir: Optional[Path] = None
+) -> ModuleExplorer:
+    """Get the module explorer, created once per process.
+
+    Creating an explorer lists the whole Woob codebase, and its caches of
+    file analyses stay valid across modules.
+
+    Args:
+        workers: Maximum number of workers analyzing files (default: automatic)
+        file_cache_dir: Directory of cached file analyses, None to disable
+
+    Returns:
+        ModuleExplorer instance
+    """
+    from .api_gap_analyzer.explorer import ModuleExplorer
+
+    # Initialize explorer with correct root path (two levels up from dev_tools)
+    return ModuleExplorer(woob_root="../..", workers=workers, disk_cache_dir=file_cache_dir)
+
+
+def explore_woob_module(
+    module_name: str,
+    cache_dir: Optional[Path] = None,
+    workers: Optional[int] = None,
+    file_cache_dir: Optional[Path] = None,
+) -> dict:
+    """Explore a Woob module.
+
+    Args:
+        module_name: Module name (e.g., 'cragr_stet')
+        cache_dir: Directory of cached explorations, None to always explore
+        workers: Maximum number of workers analyzing files (default: automatic)
+        file_cache_dir: Directory of cached file analyses, None to analyze every file
+
+    Returns:
+        Module analysis from ModuleExplorer
+    """
+    logger = logging.getLogger(__name__)
+    logger.info(f"Step 2: Exploring Woob module '{module_name}'...")
+
+    woob_analysis = None
+    if cache_dir is not None:
+        woob_analysis = load_cached_exploration(cache_dir, module_name)
+
+    if woob_analysis is not None:
+        logger.info("Reusing cached exploration, module files are unchanged")
+    else:
+        explorer = get_explorer(workers, file_cache_dir)
+        woob_analysis = explorer.explore_module(module_name)
+        if cache_dir is not None:
+            save_cached_exploration(cache_dir, module_name, explorer.woob_root, woob_analysis)
+
+    logger.info(
+        f"Found {len(woob_analysis['extracted_fields'])} extracted fields "
+        f"({len(woob_analysis['parent_analysis'])} parent classes)"
+    )
+    return woob_analysis
+
+
+def analysis_cache_key(
+    system_prompt: str, swagger_content: bytes, context: str, model_id: str = None
+) -> str:
+    """Compute the cache key of a Bedrock analysis.
+
+    The key covers the resolved model ID and the analysis instructions, so
+    that changing the default model or the instructions invalidates it.
+
+    Args:
+        system_prompt: System prompt for analysis
+        swagger_content: Raw Swagger JSON content, encoded in UTF-8
+        context: Formatted analysis context
+        model_id: Bedrock model ID, None for the default model
+
+    Returns:
+        Hexadecimal digest of the analysis inputs
+    """
+    from .api_gap_analyzer.bedrock_client import (
+        COMBINED_GAP_ANALYSIS_INSTRUCTIONS,
+        DEFAULT_MODEL_ID,
+        GAP_ANALYSIS_INSTRUCTIONS,
+    )
+
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (
+        system_prompt,
+        GAP_ANALYSIS_INSTRUCTIONS,
+        COMBINED_GAP_ANALYSIS_INSTRUCTIONS,
+        swagger_content,
+        context,
+        model_id or DEFAULT_MODEL_ID,
+    ):
+        digest.update(part if isinstance(part, bytes) else part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def load_cached_analysis(cache_dir: Path, key: str) -> dict:
+    """Load a cached Bedrock analysis result.
 
     Args:
-        seconds: Duration in seconds
+        cache_dir: Directory of cached analysis results
+        key: Cache key from analysis_cache_key()
+
+    Returns:
+        Analysis result, or None if it is not cached
+    """
+    candidates = [(cache_dir / f"{key}.json", False)]
+    if zstandard is not None:
+        candidates.insert(0, (cache_dir / f"{key}.json.zst", True))
+
+    for cache_file, compressed in candidates:
+        try:
+            with open(cache_file, "rb") as f:
+                data = f.read()
+            if compressed:
+                data = zstandard.ZstdDecompressor().decompress(data)
+            return json.loads(data)
+        except FileNotFoundError:
+            continue
+        except _CACHE_READ_ERRORS as e:
+            logging.getLogger(__name__).warning(f"Ignoring unreadable cached analysis: {e}")
+            return None
+    return None
+
+
+def save_cached_analysis(cache_dir: Path, key: str, analysis_result: dict) -> None:
+    """Save a Bedrock analysis result in the cache.
+
+    The result is written to a temporary file first, so that concurrent
+    runs never read a partially written result. Large results are
+    compressed with zstd when zstandard is installed.
+
+    Args:
+        cache_dir: Directory of cached analysis results
+        key: Cache key from analysis_cache_key()
+        analysis_result: Analysis result from BedrockAnalyzer.analyze_gap()
+    """
+    data = json.dumps(analysis_result).encode("utf-8")
+    if zstandard is not None and len(data) >= CACHE_COMPRESS_MIN_SIZE:
+        data = zstandard.ZstdCompressor(level=3).compress(data)
+        cache_file = cache_dir / f"{key}.json.zst"
+    else:
+        cache_file = cache_dir / f"{key}.json"
+
+    tmp_file = cache_dir / f"{key}.{os.getpid()}.tmp"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, "wb") as f:
+            f.write(data)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logging.getLogger(__name__).warning(f"Could not cache analysis: {e}")
+
+
+def load_all_ais_endpoints(swagger_paths: list[str]) -> list[tuple[SwaggerParser, bytes, list]]:
+    """Load several Swagger specifications and list their AIS endpoints.
+
+    Args:
+        swagger_paths: Paths to Swagger JSON files
+
+    Returns:
+        List of (SwaggerParser instance, raw JSON content, AIS endpoints) tuples
+    """
+    return [load_ais_endpoints(swagger_path) for swagger_path in swagger_paths]
+
+
+def explore_woob_modules(
+    module_names: list[str],
+    cache_dir: Optional[Path] = None,
+    workers: Optional[int] = None,
+    file_cache_dir: Optional[Path] = None,
+) -> list[dict]:
+    """Explore several Woob modules, one after the other with a shared explorer.
+
+    Args:
+        module_names: Module names (e.g., ['cragr_stet'])
+        cache_dir: Directory of cached explorations, None to always explore
+        workers: Maximum number of workers analyzing files (default: automatic)
+        file_cache_dir: Directory of cached file analyses, None to analyze every file
+
+    Returns:
+        List of module analyses from ModuleExplorer
+    """
+    return [
+        explore_woob_module(name, cache_dir, workers, file_cache_dir) for name in module_names
+    ]
+
+
+def split_combined_analysis(analysis_result: dict, module_names: list[str]) -> dict[str, dict]:
+    """Split the result of a combined analysis into results for each module.
+
+    Args:
+        analysis_result: Result from BedrockAnalyzer.analyze_gaps_combined()
+        module_names: Names of the analyzed modules
+
+    Returns:
+        Dictionary mapping module names to results like the ones of
+        BedrockAnalyzer.analyze_gap(). Modules without a report in a
+        successful analysis are left out, to be analyzed on their own.
+    """
+    results = {}
+    for module_name in module_names:
+        if analysis_result["status"] != "success":
+            results[module_name] = analysis_result
+        elif module_name in analysis_result["analyses"]:
+            results[module_name] = {
+                "status": "success",
+                "analysis": analysis_result["analyses"][module_name],
+                "usage": analysis_result["usage"],
+                "model": analysis_result["model"],
+            }
+    return results
+
+
+def report_output_path(module_name: str, output_arg: Optional[str] = None) -> Path:
+    """Get the path of the report of a module, creating its directory.
+
+    Args:
+        module_name: Module name (e.g., 'cragr_stet')
+        output_arg: Optional output path argument
+
+    Returns:
+        Path to save the report to
+    """
+    if output_arg:
+        return Path(output_arg)
+
+    # Default: save to modules/{module}/api-spec/gap_analysis_{module}.md
+    api_spec_dir = os.path.join("..", "..", "modules", module_name, "api-spec")
+    # Create directory if it doesn't exist, it usually does
+    if not os.path.isdir(api_spec_dir):
+        os.makedirs(api_spec_dir, exist_ok=True)
+    return Path(api_spec_dir, f"gap_analysis_{module_name}.md")
+
+
+def format_duration(ns: int) -> str:
+    """Format duration in nanoseconds to human-readable format.
+
+    Args:
+        ns: Duration in nanoseconds
 
     Returns:
         Formatted duration string
     """
+    seconds = ns / 1e9
     if seconds < 60:
         return f"{seconds:.1f}s"
     elif seconds < 3600:
@@ -157,13 +581,12 @@ def format_duration(seconds: float) -> str:
         return f"{hours:.1f}h"
 
 
-def main() -> int:
-    """Main entry point.
+def _build_arg_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser.
 
     Returns:
-        Exit code (0 for success, 1 for error)
+        Argument parser of the script
     """
-    start_time = time.time()
     parser = argparse.ArgumentParser(
         description="Compare Woob implementation against Bank API specification",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -178,6 +601,9 @@ Examples:
   # Specify custom output path
   python compare_scraping.py --module cragr_stet --output custom_report.md
 
+  # Analyze several modules in a single Bedrock request
+  python compare_scraping.py --module cragr_stet bnp_stet
+
   # Verbose output
   python compare_scraping.py --module cragr_stet -v
 
@@ -190,7 +616,9 @@ Report Location:
     parser.add_argument(
         "--module",
         required=True,
-        help="Module name to analyze (e.g., cragr_stet)",
+        nargs="+",
+        help="Module names to analyze (e.g., cragr_stet), several modules are analyzed "
+        "in a single Bedrock request",
     )
     parser.add_argument(
         "--capability",
@@ -209,6 +637,43 @@ Report Location:
         "--model",
         help="Bedrock model ID (optional, uses default if not specified)",
     )
+    parser.add_argument(
+        "--latency-mode",
+        choices=["standard", "optimized"],
+        default="standard",
+        help="Bedrock inference latency mode (default: standard, optimized is only "
+        "available for some models and regions)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Print the Bedrock analysis as it is generated, and write it to "
+        "<report>.partial for a single module",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always send the analysis to Bedrock, explore the Woob modules and analyze "
+        "their files, ignoring all cached results",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=DEFAULT_CACHE_DIR,
+        help="Directory of cached analyses, explorations and file analyses "
+        f"(default: {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--no-explore-cache",
+        action="store_true",
+        help="Always explore the Woob module and analyze its files, ignoring cached "
+        "explorations",
+    )
+    parser.add_argument(
+        "--explore-workers",
+        type=int,
+        help="Maximum number of workers analyzing module files, 1 to disable "
+        "concurrency (default: automatic)",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
@@ -216,7 +681,24 @@ Report Location:
         help="Enable verbose logging",
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+# Built once, at import time
+_ARG_PARSER = _build_arg_parser()
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Main entry point.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+
+    Returns:
+        Exit code (0 for success, 1 for error)
+    """
+    start_time = time.perf_counter_ns()
+    args = _ARG_PARSER.parse_args(argv)
     setup_logging(args.verbose)
     logger = logging.getLogger(__name__)
 
@@ -224,89 +706,179 @@ Report Location:
         # Validate arguments
         validate_arguments(args)
 
-        # Resolve swagger path (auto-detect if not provided)
-        swagger_path = resolve_swagger_path(args.module, args.swagger)
-        logger.info(f"Using Swagger spec: {swagger_path}")
-
-        # Step 1: Load Swagger spec
-        step1_start = time.time()
-        logger.info("Step 1: Loading Swagger specification...")
-        swagger_parser, swagger_content = load_swagger_spec(str(swagger_path))
-        ais_endpoints = swagger_parser.get_ais_endpoints()
-        logger.info(f"Found {len(ais_endpoints)} AIS endpoints")
-        step1_time = time.time() - step1_start
-
-        # Step 2: Explore Woob module
-        step2_start = time.time()
-        logger.info(f"Step 2: Exploring Woob module '{args.module}'...")
-        # Initialize explorer with correct root path (two levels up from dev_tools)
-        explorer = ModuleExplorer(woob_root="../..")
-        woob_analysis = explorer.explore_module(args.module)
-        logger.info(
-            f"Found {len(woob_analysis['extracted_fields'])} extracted fields "
-            f"({len(woob_analysis['parent_analysis'])} parent classes)"
-        )
-        step2_time = time.time() - step2_start
+        module_names = list(dict.fromkeys(args.module))
+
+        # Resolve swagger paths (auto-detect if not provided)
+        swagger_paths = []
+        for module_name in module_names:
+            swagger_path = resolve_swagger_path(module_name, args.swagger)
+            logger.info(f"Using Swagger spec: {swagger_path}")
+            swagger_paths.append(str(swagger_path))
+        cache_dir = Path(args.cache_dir).expanduser()
+        explore_cache_dir = None if args.no_cache or args.no_explore_cache else cache_dir
+        # File analyses are kept apart, one file per analyzed Woob file
+        file_cache_dir = None if explore_cache_dir is None else cache_dir / "files"
+
+        # Steps 1 and 2 share no data: load the Swagger specs while exploring
+        # the Woob modules, overlapping their file reads
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            swagger_future = executor.submit(timed, load_all_ais_endpoints, swagger_paths)
+            woob_future = executor.submit(
+                timed,
+                explore_woob_modules,
+                module_names,
+                explore_cache_dir,
+                args.explore_workers,
+                file_cache_dir,
+            )
+            swagger_results, step1_time = swagger_future.result()
+            woob_analyses, step2_time = woob_future.result()
+        swagger_contents = [swagger_content for _, swagger_content, _ in swagger_results]
 
         # Step 3: Format context for LLM
-        step3_start = time.time()
+        step3_start = time.perf_counter_ns()
         logger.info("Step 3: Formatting analysis context...")
-        context = ContextFormatter.format_comparison_context(swagger_content, woob_analysis)
-        logger.debug(f"Context size: {len(context)} characters")
-        step3_time = time.time() - step3_start
+        from .api_gap_analyzer.context_formatter import ContextFormatter
 
-        # Step 4: Send to Bedrock for analysis
-        step4_start = time.time()
-        logger.info("Step 4: Sending analysis to AWS Bedrock...")
-        bedrock = BedrockAnalyzer(model_id=args.model)
-        system_prompt = get_system_prompt()
+        contexts = []
+        for swagger_content, woob_analysis in zip(swagger_contents, woob_analyses):
+            context = ContextFormatter.format_comparison_context(swagger_content, woob_analysis)
+            logger.debug(f"Context size: {len(context)} characters")
+            contexts.append(context)
+        step3_time = time.perf_counter_ns() - step3_start
 
-        analysis_result = bedrock.analyze_gap(
-            swagger_spec=swagger_content,
-            woob_analysis=context,
-            system_prompt=system_prompt,
-        )
+        # Step 4: Send to Bedrock for analysis
+        step4_start = time.perf_counter_ns()
+        from .api_gap_analyzer.system_prompt import get_system_prompt
 
-        if analysis_result["status"] != "success":
-            logger.error(
-                f"Bedrock analysis failed: {analysis_result.get('error', 'Unknown error')}"
+        system_prompt = get_system_prompt()
+        analysis_results = {}
+        pending = []
+        for module_name, swagger_content, context in zip(module_names, swagger_contents, contexts):
+            cache_key = analysis_cache_key(system_prompt, swagger_content, context, args.model)
+            analysis_result = None if args.no_cache else load_cached_analysis(cache_dir, cache_key)
+            if analysis_result is not None:
+                logger.info(f"Step 4: Reusing cached Bedrock analysis of '{module_name}'")
+                analysis_results[module_name] = analysis_result
+            else:
+                pending.append((module_name, swagger_content, context, cache_key))
+
+        if pending:
+            logger.info("Step 4: Sending analysis to AWS Bedrock...")
+            from .api_gap_analyzer.bedrock_client import BedrockAnalyzer
+
+            bedrock = BedrockAnalyzer(model_id=args.model, latency_mode=args.latency_mode)
+
+            partial_file = None
+            on_text = None
+            if args.stream:
+                if len(pending) == 1:
+                    # Show the analysis of a single module in progress next to its report
+                    partial_path = f"{report_output_path(pending[0][0], args.output)}.partial"
+                    logger.info(f"Streaming analysis to: {partial_path}")
+                    partial_file = open(partial_path, "w", encoding="utf-8")
+
+                def on_text(text: str) -> None:
+                    sys.stdout.write(text)
+                    sys.stdout.flush()
+                    if partial_file is not None:
+                        partial_file.write(text)
+                        partial_file.flush()
+
+            try:
+                new_results = {}
+                # Modules share a request as long as their reports fit in its output
+                batch_size = bedrock.max_combined_modules()
+                for start in range(0, len(pending), batch_size):
+                    batch = pending[start : start + batch_size]
+                    if len(batch) > 1:
+                        # Share the system prompt and instructions between modules
+                        combined_result = bedrock.analyze_gaps_combined(
+                            [item[:3] for item in batch],
+                            system_prompt=system_prompt,
+                            on_text=on_text,
+                        )
+                        new_results.update(
+                            split_combined_analysis(combined_result, [item[0] for item in batch])
+                        )
+
+                    for module_name, swagger_content, context, _ in batch:
+                        if module_name in new_results:
+                            continue
+                        if len(batch) > 1:
+                            logger.warning(
+                                f"No report for '{module_name}' in the combined analysis, "
+                                "analyzing it on its own"
+                            )
+                        new_results[module_name] = bedrock.analyze_gap(
+                            swagger_spec=swagger_content,
+                            woob_analysis=context,
+                            system_prompt=system_prompt,
+                            on_text=on_text,
+                        )
+            finally:
+                if partial_file is not None:
+                    partial_file.close()
+                if on_text is not None:
+                    sys.stdout.write("\n")
+
+            # Keep the partial analysis only when no report replaces it
+            if partial_file is not None and new_results[pending[0][0]]["status"] == "success":
+                os.unlink(partial_file.name)
+
+            for module_name, _, _, cache_key in pending:
+                analysis_result = new_results[module_name]
+                if analysis_result["status"] == "success":
+                    save_cached_analysis(cache_dir, cache_key, analysis_result)
+                analysis_results[module_name] = analysis_result
+
+        failed = []
+        for module_name in module_names:
+            analysis_result = analysis_results[module_name]
+            if analysis_result["status"] != "success":
+                logger.error(
+                    f"Bedrock analysis of '{module_name}' failed: "
+                    f"{analysis_result.get('error', 'Unknown error')}"
+                )
+                failed.append(module_name)
+                continue
+
+            usage = analysis_result["usage"]
+            logger.info(
+                f"Analysis of '{module_name}' complete (tokens: {usage['input_tokens']} in, "
+                f"{usage['output_tokens']} out, {usage['cache_read_tokens']} cache read, "
+                f"{usage['cache_write_tokens']} cache write)"
             )
-            return 1
+        step4_time = time.perf_counter_ns() - step4_start
 
-        bedrock_response = analysis_result["analysis"]
-        usage = analysis_result["usage"]
-        logger.info(
-            f"Analysis complete (tokens: {usage['input_tokens']} in, {usage['output_tokens']} out)"
-        )
-        step4_time = time.time() - step4_start
+        if len(failed) == len(module_names):
+            return 1
 
-        # Step 5: Generate report
-        step5_start = time.time()
+        # Step 5: Generate reports
+        step5_start = time.perf_counter_ns()
         logger.info("Step 5: Generating markdown report...")
-        report = ReportGenerator.format_report_with_summary(
-            bedrock_response,
-            args.module,
-            "Bank API",
-        )
-        step5_time = time.time() - step5_start
-
-        # Step 6: Output report
-        step6_start = time.time()
-        if args.output:
-            output_path = Path(args.output)
-        else:
-            # Default: save to modules/{module}/api-spec/gap_analysis_{module}.md
-            module_path = Path("..") / ".." / "modules" / args.module / "api-spec"
-            output_path = module_path / f"gap_analysis_{args.module}.md"
-            # Create directory if it doesn't exist
-            module_path.mkdir(parents=True, exist_ok=True)
-
-        logger.info(f"Saving report to: {output_path}")
-        ReportGenerator.save_report(report, str(output_path))
-        step6_time = time.time() - step6_start
+        from .api_gap_analyzer.report_generator import ReportGenerator
+
+        reports = {}
+        for module_name in module_names:
+            if module_name not in failed:
+                reports[module_name] = ReportGenerator.format_report_with_summary(
+                    analysis_results[module_name]["analysis"],
+                    module_name,
+                    "Bank API",
+                )
+        step5_time = time.perf_counter_ns() - step5_start
+
+        # Step 6: Output reports
+        step6_start = time.perf_counter_ns()
+        for module_name, report in reports.items():
+            output_path = report_output_path(module_name, args.output)
+            logger.info(f"Saving report to: {output_path}")
+            ReportGenerator.save_report(report, str(output_path))
+        step6_time = time.perf_counter_ns() - step6_start
 
         # Print timing summary
-        total_time = time.time() - start_time
+        total_time = time.perf_counter_ns() - start_time
         print("\n" + "=" * 70)
         print("EXECUTION TIME SUMMARY")
         print("=" * 70)
@@ -320,6 +892,10 @@ Report Location:
         print(f"TOTAL TIME:                        {format_duration(total_time)}")
         print("=" * 70 + "\n")
 
+        if failed:
+            logger.error(f"Analysis failed for modules: {', '.join(failed)}")
+            return 1
+
         logger.info("Analysis complete!")
         return 0
 